@@ -6,6 +6,11 @@ import re
 from typing import Any, Dict, Optional
 from urllib.parse import urlencode
 
+try:
+    import orjson  # optional: 2-5x faster JSON on the findings read/write path
+except ImportError:
+    orjson = None
+
 Json = Dict[str, Any]
 
 def compose_display_url(url: str, query: Dict[str, Any]) -> str:
@@ -26,6 +31,11 @@ def safe_id(s: str) -> str:
 
 def read_json(path: str, default):
     try:
+        if orjson is not None:
+            # orjson.JSONDecodeError subclasses json.JSONDecodeError, so the
+            # error handling below covers both parsers.
+            with open(path, "rb") as f:
+                return orjson.loads(f.read())
         with open(path, "r", encoding="utf-8") as f:
             return json.load(f)
     except FileNotFoundError:
@@ -43,8 +53,19 @@ def read_json(path: str, default):
 def write_json(path: str, obj):
     tmp = path + ".tmp"
     try:
-        with open(tmp, "w", encoding="utf-8") as f:
-            json.dump(obj, f, indent=2)
+        payload = None
+        if orjson is not None:
+            try:
+                payload = orjson.dumps(obj, option=orjson.OPT_INDENT_2)
+            except TypeError:
+                # orjson rejects non-str dict keys etc.; stdlib coerces them.
+                payload = None
+        if payload is not None:
+            with open(tmp, "wb") as f:
+                f.write(payload)
+        else:
+            with open(tmp, "w", encoding="utf-8") as f:
+                json.dump(obj, f, indent=2)
         os.replace(tmp, path)
     except PermissionError as e:
         print(f"Error: Permission denied writing to {path}: {e}")
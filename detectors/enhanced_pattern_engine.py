@@ -82,7 +82,9 @@ class EnhancedPatternEngine(PatternEngine):
             if not regex:
                 continue
             
-            compiled_regex = self._compile(regex)
+            # Non-raising compile: one malformed community/imported regex
+            # must not abort loading the rest of the pack.
+            compiled_regex = self._compile_safe(regex)
             if not compiled_regex:
                 continue
             
@@ -108,9 +110,17 @@ class EnhancedPatternEngine(PatternEngine):
                 "pack_path": pattern.get("pack_path", ""),
             }
             
-            self._compiled.append(item)
+            # Route through the same per-rule finishing step as reload() so
+            # injected rules carry the derived fields detect() and the
+            # management helpers rely on.
+            self._compiled.append(self._finish_rule(item))
+            if item["id"]:
+                self._by_id[item["id"]] = item
             if pattern_id:
                 loaded_ids.add(pattern_id)
+
+        # Refresh the scan plan so the injected rules are actually scanned.
+        self._rebuild_enabled()
     
     def setup_nuclei_integration(self, nuclei_templates_dir: str):
         """Setup Nuclei templates integration."""
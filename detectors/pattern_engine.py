@@ -3,11 +3,236 @@ from __future__ import annotations
 
 import glob
 import json
+import logging
+import mmap
 import os
 import re
+import string
 import time
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
 from typing import Any, Dict, List, Optional
 
+log = logging.getLogger("pattern_engine")
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+def _json_str(x: Any) -> str:
+    """Serialize a request/response field for scanning (orjson when available)."""
+    if orjson is not None:
+        try:
+            return orjson.dumps(x).decode()
+        except TypeError:
+            return str(x)
+    try:
+        return json.dumps(x, ensure_ascii=False, separators=(",", ":"))
+    except Exception:
+        return str(x)
+
+
+# System-looking values (numbers, hashes, UUIDs) compiled once as one alternation.
+_SYS_RE = re.compile(
+    r"^(?:\d+"
+    r"|[a-f0-9]{32}"  # MD5 hash
+    r"|[a-f0-9]{40}"  # SHA1 hash
+    r"|[a-f0-9]{64}"  # SHA256 hash
+    r"|[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}"  # UUID
+    r")$",
+    re.IGNORECASE,
+)
+
+# translate() table that deletes ordinary input characters; what remains is "special".
+_NON_SPECIAL_TABLE = {ord(c): None for c in string.ascii_letters + string.digits + " -_"}
+
+_BINARY_CONTENT_TYPES = ("application/octet-stream", "image/", "video/", "audio/", "application/pdf")
+
+_GENERIC_SQL_KEYWORDS = frozenset(["SELECT", "INSERT", "UPDATE", "DELETE", "WHERE", "FROM"])
+
+# rules x body-chars below which threading costs more than it saves
+_PARALLEL_THRESHOLD = 1_000_000
+
+
+class _LiteralMatch:
+    """Minimal re.Match stand-in for literal fast-path hits."""
+    __slots__ = ("_text", "_start", "_end")
+
+    def __init__(self, text: str, start: int, end: int):
+        self._text = text
+        self._start = start
+        self._end = end
+
+    def group(self, n: int = 0) -> str:
+        if n:
+            raise IndexError("no such group")
+        return self._text[self._start:self._end]
+
+    def start(self) -> int:
+        return self._start
+
+    def end(self) -> int:
+        return self._end
+
+
+def _load_pack(path: str) -> tuple:
+    """Read and parse one pack file; returns (path, data, error_message)."""
+    try:
+        with open(path, "rb") as fh:
+            raw = fh.read()
+    except Exception as e:
+        return path, None, f"cannot read file: {e}"
+    try:
+        data = orjson.loads(raw) if orjson is not None else json.loads(raw)
+    except ValueError as e:
+        return path, None, f"cannot parse JSON: {e}"
+    return path, data, None
+
+
+def _extract_request_snippet(req: Dict[str, Any], where: str) -> str:
+    """Extract relevant request snippet based on where field."""
+    if where == "request.body":
+        body = req.get("json") or req.get("data") or ""
+        if isinstance(body, dict):
+            body = str(body)
+        return str(body)[:500]  # Limit request body snippet
+    elif where == "request.headers":
+        headers = req.get("headers", {})
+        return str(headers)[:500]
+    elif where == "request.url":
+        return req.get("url", "")[:500]
+    elif where == "request.params":
+        params = req.get("query", {})
+        return str(params)[:500]
+    return ""
+
+
+class PatternFinding:
+    """Lazy finding record returned by detect().
+
+    Behaves like the finding dict it replaces (get/[]/in/iteration) but the
+    evidence slices and 12-key meta dict are only built on first access, so
+    callers that just read title/severity never pay for them.
+    """
+    __slots__ = ("_rule", "_match", "_text", "_where", "_req", "_res",
+                 "_confidence", "_match_pos", "_snippet", "_context", "_dict")
+
+    def __init__(self, rule, match, text, where, req, res, confidence, match_pos,
+                 snippet=None, context=None):
+        self._rule = rule
+        self._match = match
+        self._text = text
+        self._where = where
+        self._req = req
+        self._res = res
+        self._confidence = confidence
+        self._match_pos = match_pos
+        self._snippet = snippet
+        self._context = context
+        self._dict = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Materialize the full finding dict (cached after first call)."""
+        if self._dict is None:
+            r = self._rule
+            m = self._match
+            snippet = self._snippet if self._snippet is not None else m.group(0)
+            context_snippet = self._context
+            if context_snippet is None:
+                text = self._text
+                if len(text) <= 200:
+                    # The whole field fits in the context window; no copy.
+                    context_snippet = text
+                else:
+                    # Slicing clamps the end index on its own.
+                    context_snippet = text[max(0, m.start() - 100):m.end() + 100]
+            req_snippet = ""
+            if self._where.startswith("request."):
+                req_snippet = _extract_request_snippet(self._req, self._where)
+            self._dict = {
+                "detector_id": f"pattern:{r['id']}" if r["id"] else "pattern",
+                "title": r["title"],
+                "severity": r["_derived_severity"],
+                "confidence": self._confidence,
+                "cwe": r.get("cwe"),
+                "cvss": r.get("cvss"),
+                "evidence": snippet if len(snippet) <= 2048 else snippet[:2048],
+                "tags": r.get("tags") or [],
+                "meta": {
+                    "where": self._where,
+                    "regex": r["regex"],
+                    "pack": r["pack_name"],
+                    "pack_version": r.get("pack_version"),
+                    "pack_path": r["pack_path"],
+                    "pattern_id": r["id"],
+                    "matched_fragment": snippet,
+                    "context_snippet": context_snippet,
+                    "request_snippet": req_snippet,
+                    "match_position": self._match_pos,
+                    "match_length": len(snippet),
+                    "response_status": self._res.get("status"),
+                    "content_type": self._res.get("headers", {}).get("content-type", ""),
+                    "request_method": self._req.get("method", ""),
+                    "request_url": self._req.get("url", ""),
+                },
+            }
+        return self._dict
+
+    def __getitem__(self, key):
+        if self._dict is None:
+            # Light fields come straight off the rule without materializing.
+            r = self._rule
+            if key == "title":
+                return r["title"]
+            if key == "severity":
+                return r["_derived_severity"]
+            if key == "confidence":
+                return self._confidence
+            if key == "cwe":
+                return r.get("cwe")
+            if key == "cvss":
+                return r.get("cvss")
+            if key == "tags":
+                return r.get("tags") or []
+            if key == "detector_id":
+                return f"pattern:{r['id']}" if r["id"] else "pattern"
+        return self.to_dict()[key]
+
+    def get(self, key, default=None):
+        try:
+            return self[key]
+        except KeyError:
+            return default
+
+    def __contains__(self, key):
+        return key in self.to_dict()
+
+    def keys(self):
+        return self.to_dict().keys()
+
+    def items(self):
+        return self.to_dict().items()
+
+    def __iter__(self):
+        return iter(self.to_dict())
+
+    def __len__(self):
+        return len(self.to_dict())
+
+    def __repr__(self):
+        return f"PatternFinding({self['detector_id']!r}, severity={self['severity']!r})"
+
+
+@lru_cache(maxsize=128)
+def _ct_flags(content_type: str) -> tuple:
+    """Return (is_binary, is_js) flags for a content-type header value."""
+    ct = content_type.lower()
+    is_binary = any(t in ct for t in _BINARY_CONTENT_TYPES)
+    is_js = "application/javascript" in ct or "text/javascript" in ct
+    return is_binary, is_js
+
 
 def _cvss_to_severity(cvss: Optional[float]) -> str:
     try:
@@ -33,32 +258,83 @@ class PatternEngine:
         self.pattern_dir = pattern_dir
         self.rule_sets: List[Dict[str, Any]] = []
         self._compiled: List[Dict[str, Any]] = []
+        self._enabled_rules: List[Dict[str, Any]] = []
+        self._scan_plan: List[tuple] = []
+        self._prefilter: Dict[str, Optional[re.Pattern]] = {}
+        self._has_literal = False
+        self._by_id: Dict[str, Dict[str, Any]] = {}
         self._compiled_cache: Dict[str, re.Pattern] = {}
         self._last_reload = 0.0
+        self._pool: Optional[ThreadPoolExecutor] = None
 
     # ---------- public API ----------
 
     def _compile(self, rx: str) -> re.Pattern:
-        """Compile regex with caching."""
-        if rx not in self._compiled_cache:
-            self._compiled_cache[rx] = re.compile(rx, re.IGNORECASE)
-        return self._compiled_cache[rx]
+        """Compile regex with caching; raises re.error on invalid patterns."""
+        ro = self._compiled_cache.get(rx)
+        if ro is None:
+            ro = self._compiled_cache[rx] = re.compile(rx, re.IGNORECASE)
+        return ro
+
+    def _compile_safe(self, rx: str) -> Optional[re.Pattern]:
+        """Like _compile but returns None on invalid patterns, for externally
+        sourced rules where one bad regex must not abort the whole load."""
+        try:
+            return self._compile(rx)
+        except re.error as e:
+            log.warning("bad regex %r: %s", rx, e)
+            return None
+
+    def _finish_rule(self, item: Dict[str, Any]) -> Dict[str, Any]:
+        """Attach the derived fields every loaded rule must carry.
+
+        detect(), get_pattern_stats() and friends rely on these keys, so
+        every path that appends to _compiled (reload() and the enhanced
+        engine's external-pattern injection) routes rules through here.
+        """
+        rx = item["regex"]
+        # Precompute lowered id/title and category flags so the hot
+        # path never calls .lower() per match.
+        item["_id_l"] = item["id"].lower()
+        item["_title_l"] = item["title"].lower()
+        item["_is_xss"] = "xss" in item["_id_l"] or "cross-site" in item["_title_l"]
+        item["_is_sql"] = "sql" in item["_id_l"] or "injection" in item["_title_l"]
+        item["_is_path"] = "path" in item["_id_l"] or "traversal" in item["_title_l"]
+        # Severity derived from CVSS once at load, not per match.
+        item["_derived_severity"] = item["severity"] or _cvss_to_severity(item.get("cvss"))
+        # Literal regexes (no metacharacters) match via str.find on a
+        # lowercased field instead of the regex engine. The rules are
+        # compiled with IGNORECASE, so the literal is lowercased too.
+        rx_body = rx[4:] if rx.startswith("(?i)") else rx
+        item["_literal"] = rx_body.lower() if re.escape(rx_body) == rx_body else None
+        # Bytes twin so disk-backed (mmap) bodies can be searched
+        # without materializing a str copy.
+        try:
+            item["_re_b"] = re.compile(rx.encode("utf-8"), re.IGNORECASE)
+        except (re.error, UnicodeEncodeError):
+            item["_re_b"] = None
+        return item
+
+    def _validate_rule(self, r: Dict[str, Any]) -> tuple:
+        """Enhanced rule validation with comprehensive checks.
 
-    def _validate_rule(self, r: Dict[str, Any]) -> List[str]:
-        """Enhanced rule validation with comprehensive checks."""
+        Returns (errors, compiled_pattern_or_None) so reload() can reuse the
+        pattern compiled here instead of compiling the regex a second time.
+        """
         errs = []
-        
+        ro = None
+
         # Required fields
-        if not r.get("regex"): 
+        if not r.get("regex"):
             errs.append("missing regex")
-        if not r.get("title"): 
+        if not r.get("title"):
             errs.append("missing title")
-        
+
         # Regex validation with compilation test
         regex = r.get("regex", "")
         if regex:
             try:
-                self._compile(regex)
+                ro = self._compile(regex)
             except re.error as e:
                 errs.append(f"bad regex: {e}")
         
@@ -92,35 +368,38 @@ class PatternEngine:
         severity = r.get("severity")
         if severity and severity not in ["info", "low", "medium", "high", "critical"]:
             errs.append("severity must be one of: info, low, medium, high, critical")
-        
-        return errs
+
+        return errs, ro
 
     def reload(self) -> None:
         """Load (or reload) all JSON packs from the directory with validation."""
         self.rule_sets = []
         self._compiled = []
-        self._compiled_cache.clear()  # Clear cache on reload
-        
+        # _compiled_cache is kept across reloads: it is keyed by the regex
+        # source, so unchanged rules reuse their compiled pattern for free.
+
         if not os.path.isdir(self.pattern_dir):
-            print(f"[patterns] directory not found: {self.pattern_dir}")
+            log.warning("directory not found: %s", self.pattern_dir)
             return
-            
+
         paths = sorted(glob.glob(os.path.join(self.pattern_dir, "*.json")))
-        for p in paths:
-            try:
-                with open(p, "r", encoding="utf-8") as fh:
-                    try:
-                        data = json.load(fh)
-                    except json.JSONDecodeError as e:
-                        print(f"[patterns] skip {p}: cannot parse JSON: line {e.lineno} col {e.colno} — {e.msg}")
-                        continue
-            except Exception as e:
-                print(f"[patterns] skip {p}: cannot read file: {e}")
+
+        # Read and parse the pack files on a thread pool so disk I/O and JSON
+        # decoding overlap; rule validation/compilation stays sequential.
+        if len(paths) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(paths))) as ex:
+                results = list(ex.map(_load_pack, paths))
+        else:
+            results = [_load_pack(p) for p in paths]
+
+        for p, data, err in results:
+            if err:
+                log.warning("skip %s: %s", p, err)
                 continue
 
             rules = data.get("rules") or data.get("patterns", [])
             if not isinstance(rules, list):
-                print(f"[patterns] skip {p}: 'rules' must be a list")
+                log.warning("skip %s: 'rules' must be a list", p)
                 continue
 
             pack_name = data.get("name") or os.path.basename(p)
@@ -129,17 +408,11 @@ class PatternEngine:
                 if r.get("enabled") is False:
                     continue  # allow toggle without deletion
                     
-                errs = self._validate_rule(r)
+                errs, ro = self._validate_rule(r)
                 if errs:
-                    print(f"[patterns] skip rule in {p}: {', '.join(errs)}")
-                    continue
-                    
-                try:
-                    rx = r.get("regex", "")
-                    ro = self._compile(rx)
-                except Exception as e:
-                    print(f"[patterns] skip rule (compile) in {p}: {e}")
+                    log.warning("skip rule in %s: %s", p, ", ".join(errs))
                     continue
+                rx = r.get("regex", "")
                 where = r.get("where") or ["response.body"]
                 if isinstance(where, str):
                     where = [where]
@@ -169,108 +442,180 @@ class PatternEngine:
                     "allow_minified_content": r.get("allow_minified_content", False),
                     "allow_minified_js": r.get("allow_minified_js", False),
                 }
-                self._compiled.append(item)
+                self._compiled.append(self._finish_rule(item))
 
             self.rule_sets.append(data)
+
+        # id -> rule index for O(1) management lookups (duplicate ids across
+        # packs are last-wins)
+        self._by_id = {}
+        for r in self._compiled:
+            if r["id"]:
+                if r["id"] in self._by_id:
+                    log.warning("duplicate rule id %r (pack %s); last wins", r["id"], r["pack_name"])
+                self._by_id[r["id"]] = r
+
+        self._rebuild_enabled()
         self._last_reload = time.time()
-        print(f"[pattern] loaded {len(self._compiled)} rules from {len(paths)} file(s)")
+        log.info("loaded %d rules from %d file(s)", len(self._compiled), len(paths))
 
     def detect(self, req: Dict[str, Any], res: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Run all compiled rules against a request/response pair.
         Returns a list of finding dicts (not persisted; caller decides).
         """
+        # Fields are re-extracted on every call: callers reuse and mutate
+        # their req/res dicts, so any cache keyed on the pair would serve
+        # stale fields, and extraction is cheap next to the scan itself.
+        # Disk-backed bodies are mmap'd for zero-copy scanning and closed
+        # once the scan completes.
         text_fields = self._extract_text_fields(req, res)
+        mm = text_fields.get("response.body")
+        try:
+            return self._detect_fields(text_fields, req, res)
+        finally:
+            if isinstance(mm, mmap.mmap):
+                mm.close()
+
+    def _detect_fields(self, text_fields: Dict[str, Any], req: Dict[str, Any],
+                       res: Dict[str, Any]) -> List[Dict[str, Any]]:
+        plan = self._scan_plan
+
+        # Lowercased copies for the literal str.find fast path, built once per
+        # call and only when at least one literal rule is loaded.
+        lower_fields = None
+        if self._has_literal:
+            lower_fields = {w: s.lower() for w, s in text_fields.items() if isinstance(s, str)}
+
+        # Single fused scan per field; fields no rule can match are skipped
+        # entirely in the per-rule loop below.
+        skip_fields = set()
+        for w, crx in self._prefilter.items():
+            if crx is None:
+                continue
+            s = text_fields.get(w)
+            if s and isinstance(s, str) and not crx.search(s):
+                skip_fields.add(w)
+
+        # re.search releases the GIL while scanning, so large responses with
+        # many rules benefit from running rule buckets on a thread pool.
+        max_len = max(map(len, text_fields.values()), default=0)
+        if len(plan) > 1 and len(plan) * max_len >= _PARALLEL_THRESHOLD:
+            n = os.cpu_count() or 1
+            chunk = -(-len(plan) // n)
+            buckets = [plan[i:i + chunk] for i in range(0, len(plan), chunk)]
+            if self._pool is None:
+                self._pool = ThreadPoolExecutor(max_workers=n)
+            parts = self._pool.map(
+                lambda bucket: self._detect_rules(bucket, text_fields, lower_fields, skip_fields, req, res),
+                buckets,
+            )
+            return [f for part in parts for f in part]
+
+        return self._detect_rules(plan, text_fields, lower_fields, skip_fields, req, res)
+
+    def detect_many(self, pairs: List[tuple]) -> List[List[Dict[str, Any]]]:
+        """Run detect over many (req, res) pairs; one findings list per pair."""
+        detect = self.detect
+        return [detect(req, res) for req, res in pairs]
+
+    def _detect_rules(self, plan: List[tuple], text_fields: Dict[str, str],
+                      lower_fields: Optional[Dict[str, str]], skip_fields: set,
+                      req: Dict[str, Any], res: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """Run one bucket of the scan plan against the extracted text fields."""
         out: List[Dict[str, Any]] = []
-        for r in self._compiled:
-            for w in r["where"]:
+        for r, lit, search, where in plan:
+            for w in where:
+                if w in skip_fields:
+                    continue
                 s = text_fields.get(w, "")
                 if not s:
                     continue
-                m = r["re"].search(s)
-                if not m:
-                    continue
-                
+                if isinstance(s, str):
+                    if lit is not None and lower_fields is not None:
+                        idx = lower_fields[w].find(lit)
+                        if idx < 0:
+                            continue
+                        m = _LiteralMatch(s, idx, idx + len(lit))
+                    else:
+                        m = search(s)
+                        if not m:
+                            continue
+                    match_pos = m.start()
+                    gate_text = s
+                    # snippet/context are sliced lazily by PatternFinding
+                    snippet = None
+                    context_snippet = None
+                else:
+                    # mmap / bytes body: search with the bytes-compiled twin
+                    # and decode only a bounded window around the hit.
+                    rb = r.get("_re_b")
+                    if rb is None:
+                        continue
+                    mb = rb.search(s)
+                    if not mb:
+                        continue
+                    if len(s) > 1000000 and not r.get("allow_large_responses", False):
+                        continue
+                    match_pos = mb.start()
+                    context_start = max(0, mb.start() - 100)
+                    context_end = min(len(s), mb.end() + 100)
+                    context_snippet = bytes(s[context_start:context_end]).decode("utf-8", "replace")
+                    snippet = bytes(s[mb.start():mb.end()]).decode("utf-8", "replace")
+                    # Gates see the decoded window; the size gate already ran
+                    # on the full mmap length above.
+                    gate_text = context_snippet
+                    m = _LiteralMatch(context_snippet, mb.start() - context_start,
+                                      mb.end() - context_start)
+
                 # Apply false-positive reducers
-                if not self._should_report_match(r, m, s, req, res):
+                if not self._should_report_match(r, m, gate_text, req, res):
                     continue
-                
-                # Enhanced evidence capture
-                snippet = m.group(0)
-                context_start = max(0, m.start() - 100)
-                context_end = min(len(s), m.end() + 100)
-                context_snippet = s[context_start:context_end]
-                
-                # Extract request snippet for context
-                req_snippet = ""
-                if w.startswith("request."):
-                    req_snippet = self._extract_request_snippet(req, w)
-                
+
                 # Calculate enhanced confidence based on context
-                enhanced_confidence = self._calculate_enhanced_confidence(r, m, s, req, res)
-                
-                sev = r.get("severity") or _cvss_to_severity(r.get("cvss"))
-                out.append({
-                    "detector_id": f"pattern:{r['id']}" if r["id"] else "pattern",
-                    "title": r["title"],
-                    "severity": sev,
-                    "confidence": enhanced_confidence,
-                    "cwe": r.get("cwe"),
-                    "cvss": r.get("cvss"),
-                    "evidence": snippet[:2048],
-                    "tags": r.get("tags") or [],
-                    "meta": {
-                        "where": w,
-                        "regex": r["regex"],
-                        "pack": r["pack_name"],
-                        "pack_version": r.get("pack_version"),
-                        "pack_path": r["pack_path"],
-                        "pattern_id": r["id"],
-                        "matched_fragment": snippet,
-                        "context_snippet": context_snippet,
-                        "request_snippet": req_snippet,
-                        "match_position": m.start(),
-                        "match_length": len(snippet),
-                        "response_status": res.get("status"),
-                        "content_type": res.get("headers", {}).get("content-type", ""),
-                        "request_method": req.get("method", ""),
-                        "request_url": req.get("url", ""),
-                    }
-                })
+                enhanced_confidence = self._calculate_enhanced_confidence(r, m, gate_text, req, res)
+
+                out.append(PatternFinding(
+                    r, m, gate_text, w, req, res, enhanced_confidence, match_pos,
+                    snippet=snippet, context=context_snippet,
+                ))
                 break  # one hit per rule is enough
         return out
 
-    def _extract_request_snippet(self, req: Dict[str, Any], where: str) -> str:
-        """Extract relevant request snippet based on where field."""
-        if where == "request.body":
-            body = req.get("json") or req.get("data") or ""
-            if isinstance(body, dict):
-                body = str(body)
-            return str(body)[:500]  # Limit request body snippet
-        elif where == "request.headers":
-            headers = req.get("headers", {})
-            return str(headers)[:500]
-        elif where == "request.url":
-            return req.get("url", "")[:500]
-        elif where == "request.params":
-            params = req.get("query", {})
-            return str(params)[:500]
-        return ""
-
     def _should_report_match(self, rule: Dict[str, Any], match: re.Match, text: str, req: Dict[str, Any], res: Dict[str, Any]) -> bool:
-        """Apply false-positive reducers to determine if match should be reported."""
+        """Apply false-positive reducers to determine if match should be reported.
+
+        Gates are ordered cheapest-first (integer compares, then length checks,
+        then content scans) so most rejections happen before any expensive work.
+        """
+        # Response status gates - O(1) integer compares
+        status = res.get("status")
+        if status and rule.get("status_gate", True):  # Default to enabled
+            # Skip error responses unless explicitly allowed
+            if status >= 400 and not rule.get("allow_error_responses", False):
+                return False
+
+            # Skip redirects unless explicitly allowed
+            if 300 <= status < 400 and not rule.get("allow_redirects", False):
+                return False
+
+        # Size gates - skip very large responses
+        if len(text) > 1000000:  # 1MB limit
+            if not rule.get("allow_large_responses", False):
+                return False
+
         matched_text = match.group(0)
-        
+
         # Context gates - check if reflected value is reasonable
         if rule.get("context_gate", True):  # Default to enabled
             # Skip if matched text is too long (likely not user input)
             if len(matched_text) > 1000:
                 return False
-            
+
             # Skip if matched text is purely alphanumeric and long (likely not user input)
             if len(matched_text) > 100 and matched_text.replace(" ", "").isalnum():
                 return False
-            
+
             # Skip if matched text appears to be a UUID or hash
             if len(matched_text) == 32 and matched_text.replace("-", "").isalnum():
                 return False
@@ -278,66 +623,42 @@ class PatternEngine:
                 return False
             if len(matched_text) == 64 and matched_text.isalnum():  # SHA256
                 return False
-        
-        # Content-type gates
-        content_type = res.get("headers", {}).get("content-type", "").lower()
+
+        # Content-type gates - flags cached per content-type string
+        is_js = False
         if rule.get("content_type_gate", True):  # Default to enabled
+            is_binary, is_js = _ct_flags(res.get("headers", {}).get("content-type", ""))
             # Skip binary content types unless explicitly allowed
-            binary_types = ["application/octet-stream", "image/", "video/", "audio/", "application/pdf"]
-            if any(ct in content_type for ct in binary_types):
-                if not rule.get("allow_binary_content", False):
-                    return False
-            
-            # Skip minified JavaScript unless explicitly allowed
-            if "application/javascript" in content_type or "text/javascript" in content_type:
-                if self._is_minified_content(text) and not rule.get("allow_minified_js", False):
-                    return False
-        
-        # Minified content detection
-        if rule.get("minified_gate", True):  # Default to enabled
-            if self._is_minified_content(text):
-                # Skip minified content unless explicitly allowed
-                if not rule.get("allow_minified_content", False):
-                    return False
-        
-        # Response status gates
-        status = res.get("status")
-        if status and rule.get("status_gate", True):  # Default to enabled
-            # Skip error responses unless explicitly allowed
-            if status >= 400 and not rule.get("allow_error_responses", False):
+            if is_binary and not rule.get("allow_binary_content", False):
                 return False
-            
-            # Skip redirects unless explicitly allowed
-            if 300 <= status < 400 and not rule.get("allow_redirects", False):
-                return False
-        
-        # Size gates - skip very large responses
-        if len(text) > 1000000:  # 1MB limit
-            if not rule.get("allow_large_responses", False):
-                return False
-        
-        # Pattern-specific gates
-        pattern_id = rule.get("id", "")
-        
+
+        # Minified content detection - single scan shared by the JS and
+        # generic minification gates
+        check_minified_js = is_js and not rule.get("allow_minified_js", False)
+        check_minified = rule.get("minified_gate", True) and not rule.get("allow_minified_content", False)
+        if (check_minified_js or check_minified) and self._is_minified_content(text):
+            return False
+
+        # Pattern-specific gates - category flags precomputed at reload()
+
         # XSS-specific gates
-        if "xss" in pattern_id.lower() or "cross-site" in rule.get("title", "").lower():
+        if rule.get("_is_xss"):
             # Skip if matched text doesn't look like user input
             if not self._looks_like_user_input(matched_text):
                 return False
-        
+
         # SQL injection gates
-        if "sql" in pattern_id.lower() or "injection" in rule.get("title", "").lower():
+        if rule.get("_is_sql"):
             # Skip if matched text is too generic
-            generic_sql_patterns = ["SELECT", "INSERT", "UPDATE", "DELETE", "WHERE", "FROM"]
-            if matched_text.upper() in generic_sql_patterns:
+            if matched_text.upper() in _GENERIC_SQL_KEYWORDS:
                 return False
-        
+
         # Path traversal gates
-        if "path" in pattern_id.lower() or "traversal" in rule.get("title", "").lower():
+        if rule.get("_is_path"):
             # Skip if matched text doesn't contain path separators
             if "../" not in matched_text and "..\\" not in matched_text:
                 return False
-        
+
         return True
 
     def _is_minified_content(self, text: str) -> bool:
@@ -365,24 +686,15 @@ class PatternEngine:
         if len(text) > 200:
             return False
         
-        # Skip if contains system-like patterns
-        system_patterns = [
-            r"^\d+$",  # Pure numbers
-            r"^[a-f0-9]{32}$",  # MD5 hash
-            r"^[a-f0-9]{40}$",  # SHA1 hash
-            r"^[a-f0-9]{64}$",  # SHA256 hash
-            r"^[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}$",  # UUID
-        ]
-        
-        for pattern in system_patterns:
-            if re.match(pattern, text, re.IGNORECASE):
-                return False
-        
+        # Skip if it matches a system-like pattern (number, hash, UUID)
+        if _SYS_RE.match(text):
+            return False
+
         # Skip if mostly special characters
-        special_char_ratio = sum(1 for c in text if not c.isalnum() and c not in " -_") / len(text)
+        special_char_ratio = len(text.translate(_NON_SPECIAL_TABLE)) / len(text)
         if special_char_ratio > 0.5:
             return False
-        
+
         return True
 
     def _calculate_enhanced_confidence(self, rule: Dict[str, Any], match: re.Match, text: str, req: Dict[str, Any], res: Dict[str, Any]) -> int:
@@ -447,7 +759,7 @@ class PatternEngine:
         out = []
         if not text:
             return out
-        for r in self._compiled:
+        for r in self._enabled_rules:
             m = r["re"].search(text)
             if m:
                 out.append({
@@ -463,34 +775,28 @@ class PatternEngine:
 
     def get_pattern_stats(self) -> Dict[str, Any]:
         """Comprehensive statistics for debugging/metrics."""
-        enabled = sum(1 for r in self._compiled if r.get("enabled", True))
-        disabled = len(self._compiled) - enabled
-        
-        # Count by pack
-        pack_stats = {}
+        # Single pass over the rules builds all breakdowns at once.
+        enabled = 0
+        pack_stats: Dict[str, Dict[str, int]] = {}
+        severity_stats: Dict[str, int] = {}
+        cwe_stats: Dict[str, int] = {}
         for rule in self._compiled:
-            pack_name = rule.get("pack_name", "unknown")
-            if pack_name not in pack_stats:
-                pack_stats[pack_name] = {"total": 0, "enabled": 0, "disabled": 0}
-            pack_stats[pack_name]["total"] += 1
-            if rule.get("enabled", True):
-                pack_stats[pack_name]["enabled"] += 1
-            else:
-                pack_stats[pack_name]["disabled"] += 1
-        
-        # Count by severity
-        severity_stats = {}
-        for rule in self._compiled:
-            sev = rule.get("severity") or _cvss_to_severity(rule.get("cvss"))
+            en = rule.get("enabled", True)
+            enabled += en
+
+            ps = pack_stats.setdefault(rule.get("pack_name", "unknown"),
+                                       {"total": 0, "enabled": 0, "disabled": 0})
+            ps["total"] += 1
+            ps["enabled" if en else "disabled"] += 1
+
+            sev = rule["_derived_severity"]
             severity_stats[sev] = severity_stats.get(sev, 0) + 1
-        
-        # Count by CWE
-        cwe_stats = {}
-        for rule in self._compiled:
+
             cwe = rule.get("cwe")
             if cwe:
                 cwe_stats[cwe] = cwe_stats.get(cwe, 0) + 1
-        
+        disabled = len(self._compiled) - enabled
+
         return {
             "total_rules": len(self._compiled),
             "enabled_rules": enabled,
@@ -505,24 +811,22 @@ class PatternEngine:
 
     def test_pattern(self, rule_id: str, test_text: str) -> bool:
         """Test a specific pattern against text."""
-        for rule in self._compiled:
-            if rule["id"] == rule_id:
-                return bool(rule["re"].search(test_text))
-        return False
+        rule = self._by_id.get(rule_id)
+        if rule is None:
+            return False
+        return bool(rule["re"].search(test_text))
     
     def test_all_patterns(self, test_text: str) -> List[Dict[str, Any]]:
         """Test all patterns against given text and return matches."""
         matches = []
-        for rule in self._compiled:
-            if not rule.get("enabled", True):
-                continue
+        for rule in self._enabled_rules:
             m = rule["re"].search(test_text)
             if m:
                 matches.append({
                     "rule_id": rule["id"],
                     "title": rule["title"],
                     "pack": rule["pack_name"],
-                    "severity": rule.get("severity") or _cvss_to_severity(rule.get("cvss")),
+                    "severity": rule["_derived_severity"],
                     "cwe": rule.get("cwe"),
                     "cvss": rule.get("cvss"),
                     "confidence": rule["confidence"],
@@ -540,7 +844,7 @@ class PatternEngine:
                 "enabled": rule.get("enabled", True),
                 "pack": rule["pack_name"],
                 "pack_version": rule.get("pack_version"),
-                "severity": rule.get("severity") or _cvss_to_severity(rule.get("cvss")),
+                "severity": rule["_derived_severity"],
                 "cwe": rule.get("cwe"),
                 "cvss": rule.get("cvss"),
                 "confidence": rule["confidence"],
@@ -552,39 +856,53 @@ class PatternEngine:
     
     def get_pattern_by_id(self, rule_id: str) -> Optional[Dict[str, Any]]:
         """Get a specific pattern by its ID."""
-        for rule in self._compiled:
-            if rule["id"] == rule_id:
-                return rule
-        return None
-    
+        return self._by_id.get(rule_id)
+
     def toggle_pattern(self, rule_id: str, enabled: bool) -> bool:
         """Enable/disable a specific pattern."""
-        for rule in self._compiled:
-            if rule["id"] == rule_id:
-                rule["enabled"] = enabled
-                return True
-        return False
-
-    # ---------- internals ----------
+        rule = self._by_id.get(rule_id)
+        if rule is None:
+            return False
+        rule["enabled"] = enabled
+        self._rebuild_enabled()
+        return True
 
-    def _compile(self, rx: str) -> Optional[re.Pattern]:
-        if rx in self._compiled_cache:
-            return self._compiled_cache[rx]
-        try:
-            obj = re.compile(rx, re.IGNORECASE)
-            self._compiled_cache[rx] = obj
-            return obj
-        except Exception as e:
-            print(f"[pattern] invalid regex: {rx!r} -> {e}")
-            return None
+    def _rebuild_enabled(self) -> None:
+        """Refresh the prefiltered list detect() iterates over."""
+        self._enabled_rules = [r for r in self._compiled if r.get("enabled", True)]
+        self._has_literal = any(r.get("_literal") is not None for r in self._enabled_rules)
+        # Flat scan plan with the literal, bound search method and where-tuple
+        # pre-extracted, so the hot loop unpacks a tuple instead of doing
+        # dict lookups per rule per call.
+        self._scan_plan = [
+            (r, r.get("_literal"), r["re"].search, tuple(r["where"]))
+            for r in self._enabled_rules
+        ]
+        # Fused per-field prefilter: one C-level scan of an alternation of all
+        # rule regexes decides whether any rule can match a field before the
+        # per-rule loop runs. Fields whose rules use backreferences (which
+        # would rebind inside an alternation) or have too few rules to be
+        # worth a second scan are left unfiltered.
+        by_where: Dict[str, List[str]] = {}
+        unsafe: set = set()
+        for r in self._enabled_rules:
+            for w in r["where"]:
+                by_where.setdefault(w, []).append(r["regex"])
+                if re.search(r"\\\d|\(\?P=", r["regex"]):
+                    unsafe.add(w)
+        self._prefilter = {}
+        for w, rxs in by_where.items():
+            if w in unsafe or len(rxs) < 4:
+                self._prefilter[w] = None
+                continue
+            try:
+                self._prefilter[w] = re.compile("|".join(f"(?:{x})" for x in rxs), re.IGNORECASE)
+            except re.error:
+                self._prefilter[w] = None
 
+    # ---------- internals ----------
 
-    def _extract_text_fields(self, req: Dict[str, Any], res: Dict[str, Any]) -> Dict[str, str]:
-        def _json_str(x: Any) -> str:
-            try:
-                return json.dumps(x, ensure_ascii=False)
-            except Exception:
-                return str(x)
+    def _extract_text_fields(self, req: Dict[str, Any], res: Dict[str, Any]) -> Dict[str, Any]:
         out = {
             "request.url": req.get("url") or "",
             "request.headers": _json_str(req.get("headers")),
@@ -594,6 +912,18 @@ class PatternEngine:
             "response.headers": _json_str(res.get("headers")),
             "response.body": str(res.get("body") or ""),
         }
+        # Disk-backed bodies are scanned through the page cache instead of
+        # being copied into an interpreter str. detect() closes the mmap.
+        body_path = res.get("body_path")
+        if body_path and not res.get("body"):
+            try:
+                fd = os.open(body_path, os.O_RDONLY)
+                try:
+                    out["response.body"] = mmap.mmap(fd, 0, access=mmap.ACCESS_READ)
+                finally:
+                    os.close(fd)
+            except (OSError, ValueError) as e:
+                log.warning("cannot mmap body %s: %s", body_path, e)
         return out
 
 # Singleton pattern engine instance
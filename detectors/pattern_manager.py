@@ -3,14 +3,149 @@
 Pattern Manager - Advanced pattern management with per-project directories,
 community packs, and external integrations.
 """
+import fnmatch
 import json
+import os
+import re
 import shutil
+import threading
 import zipfile
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 from typing import Any, Dict, List, Optional, Tuple
 
-import requests
+import urllib3
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pandas as pd
+except ImportError:
+    pd = None
+
+# Below this many rules the plain Counter pass beats the DataFrame
+# construction overhead, so the vectorized path only kicks in above it.
+_VECTORIZE_MIN_RULES = 5000
+
+
+def _load_json_file(path) -> Any:
+    """Parse a JSON file (orjson when available); raises ValueError/OSError."""
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if orjson is not None else json.loads(raw)
+
+
+def _dump_json_file(path, obj) -> None:
+    """Write indented JSON (orjson when available, bytes straight to disk)."""
+    if orjson is not None:
+        with open(path, 'wb') as f:
+            f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2))
+    else:
+        with open(path, 'w') as f:
+            json.dump(obj, f, indent=2)
+
+
+def _load_pattern_file(entry):
+    """Load one (pack_type, default_name, path) entry; errors are returned."""
+    try:
+        return entry, _load_json_file(entry[2]), None
+    except (ValueError, OSError) as e:
+        return entry, None, e
+
+
+def _iter_json_files(dir_path):
+    """Yield paths of *.json entries in dir_path via os.scandir."""
+    try:
+        with os.scandir(dir_path) as it:
+            for entry in it:
+                if entry.name.endswith(".json") and entry.is_file():
+                    yield entry.path
+    except OSError:
+        return
+
+
+# Accepts "CWE-79", "cwe_79", or a bare number, with surrounding whitespace.
+_CWE_RE = re.compile(r"^\s*(?:CWE[-_]?)?(\d+)\s*$", re.IGNORECASE)
+
+_REQUIRED_FIELDS = ("id", "title", "regex")
+
+_VALID_SEVERITIES = ("info", "low", "medium", "high", "critical")
+_VALID_SEVERITY_SET = frozenset(_VALID_SEVERITIES)
+
+_VALID_WHERE_VALUES = (
+    "request.body", "request.headers", "request.url", "request.params",
+    "response.body", "response.headers", "response.status",
+)
+_VALID_WHERE_SET = frozenset(_VALID_WHERE_VALUES)
+
+
+# Archive entries each pack converter actually reads. The current placeholder
+# converters synthesize their rules, so nothing needs extracting yet; packs
+# missing from this table fall back to a full extract.
+_PACK_EXTRACT_WHITELIST = {
+    "owasp-crs": [],
+    "nuclei-templates": [],
+    "security-patterns": [],
+}
+
+
+def _confidence_bin(confidence) -> str:
+    if confidence >= 90:
+        return "90-100"
+    if confidence >= 70:
+        return "70-89"
+    if confidence >= 50:
+        return "50-69"
+    return "0-49"
+
+
+@lru_cache(maxsize=4096)
+def _compile_ci(pattern: str) -> re.Pattern:
+    """Case-insensitive regex compile, memoized for bulk validation."""
+    return re.compile(pattern, re.IGNORECASE)
+
+
+class PatternBundle:
+    """Columnar (structure-of-arrays) view of a pattern list.
+
+    Scan-heavy consumers walk the parallel arrays directly — one compiled
+    regex per slot — instead of doing per-rule dict lookups on every
+    request. Rules missing an id/regex or with an uncompilable regex are
+    validated out at build time.
+    """
+
+    __slots__ = ("ids", "compiled", "severities", "confidences", "enabled", "rules")
+
+    def __init__(self, rules: List[Dict[str, Any]]):
+        self.ids: List[str] = []
+        self.compiled: List[re.Pattern] = []
+        self.severities: List[str] = []
+        self.confidences: List[int] = []
+        self.enabled: List[bool] = []
+        self.rules: List[Dict[str, Any]] = []
+        for rule in rules:
+            regex = rule.get("regex")
+            if not rule.get("id") or not isinstance(regex, str):
+                continue
+            try:
+                rx = _compile_ci(regex)
+            except re.error:
+                continue
+            self.ids.append(rule["id"])
+            self.compiled.append(rx)
+            self.severities.append(rule.get("severity", "info"))
+            self.confidences.append(int(rule.get("confidence", 50)))
+            self.enabled.append(bool(rule.get("enabled", True)))
+            self.rules.append(rule)
+
+    def __len__(self) -> int:
+        return len(self.ids)
 
 
 class PatternManager:
@@ -31,10 +166,10 @@ class PatternManager:
         self.cache_dir = self.patterns_dir / "cache"
         self.temp_dir = self.patterns_dir / "temp"
         
-        # Create directory structure
-        for dir_path in [self.patterns_dir, self.community_dir, self.projects_dir, 
-                        self.cache_dir, self.temp_dir]:
-            dir_path.mkdir(parents=True, exist_ok=True)
+        # Create directory structure. cache/ and temp/ are only needed by
+        # pack downloads, so they are created lazily on first use.
+        for dir_path in (self.patterns_dir, self.community_dir, self.projects_dir):
+            os.makedirs(dir_path, exist_ok=True)
         
         # Community pack sources
         self.community_sources = {
@@ -61,22 +196,44 @@ class PatternManager:
             }
         }
         
+        # Pooled HTTP client shared by all pack downloads so concurrent
+        # updates reuse one TLS connection per host.
+        self._http = urllib3.PoolManager(
+            num_pools=4, maxsize=4, retries=urllib3.Retry(3))
+
+        # Aggregated pattern list cache; invalidated when the pattern
+        # directories' mtimes move or packs/projects are written. The bundle
+        # is the columnar, pre-compiled view of the same data.
+        self._patterns_cache: Optional[List[Dict[str, Any]]] = None
+        self._patterns_cache_key: Optional[Tuple[Optional[str], float]] = None
+        self._bundle: Optional["PatternBundle"] = None
+        self._bundle_key: Optional[Tuple[Optional[str], float]] = None
+
+        # Skip redundant metadata.json parses/writes on repeat update calls.
+        self._metadata_mtime: Optional[float] = None
+        self._last_metadata_bytes: Optional[bytes] = None
+
         # Load community pack metadata
         self._load_community_metadata()
-    
+
     def _load_community_metadata(self):
         """Load community pack update timestamps and status."""
         metadata_file = self.community_dir / "metadata.json"
-        if metadata_file.exists():
-            try:
-                with open(metadata_file, 'r') as f:
-                    metadata = json.load(f)
-                    for pack_id, pack_data in metadata.items():
-                        if pack_id in self.community_sources:
-                            self.community_sources[pack_id].update(pack_data)
-            except Exception as e:
-                print(f"Warning: Could not load community metadata: {e}")
-    
+        try:
+            mtime = os.stat(metadata_file).st_mtime
+        except OSError:
+            return
+        if mtime == self._metadata_mtime:
+            return
+        try:
+            metadata = _load_json_file(metadata_file)
+            for pack_id, pack_data in metadata.items():
+                if pack_id in self.community_sources:
+                    self.community_sources[pack_id].update(pack_data)
+            self._metadata_mtime = mtime
+        except Exception as e:
+            print(f"Warning: Could not load community metadata: {e}")
+
     def _save_community_metadata(self):
         """Save community pack metadata."""
         metadata_file = self.community_dir / "metadata.json"
@@ -84,11 +241,25 @@ class PatternManager:
         for pack_id, pack_data in self.community_sources.items():
             metadata[pack_id] = {
                 "last_updated": pack_data.get("last_updated"),
-                "enabled": pack_data.get("enabled", True)
+                "enabled": pack_data.get("enabled", True),
+                "etag": pack_data.get("etag"),
+                "last_modified": pack_data.get("last_modified")
             }
-        
-        with open(metadata_file, 'w') as f:
-            json.dump(metadata, f, indent=2)
+
+        if orjson is not None:
+            payload = orjson.dumps(metadata, option=orjson.OPT_INDENT_2)
+        else:
+            payload = json.dumps(metadata, indent=2).encode()
+        if payload == self._last_metadata_bytes:
+            # Nothing changed since the last write; skip the disk round trip.
+            return
+        with open(metadata_file, 'wb') as f:
+            f.write(payload)
+        self._last_metadata_bytes = payload
+        try:
+            self._metadata_mtime = os.stat(metadata_file).st_mtime
+        except OSError:
+            self._metadata_mtime = None
     
     def create_project_patterns(self, project_id: str) -> bool:
         """Create a dedicated pattern directory for a project."""
@@ -116,11 +287,12 @@ class PatternManager:
         }
         
         patterns_file = project_pattern_dir / "custom_patterns.json"
-        with open(patterns_file, 'w') as f:
-            json.dump(default_patterns, f, indent=2)
-        
+        _dump_json_file(patterns_file, default_patterns)
+
+        self._patterns_cache = None
+        self._bundle = None
         return True
-    
+
     def get_project_patterns(self, project_id: str) -> List[Dict[str, Any]]:
         """Get all patterns for a specific project."""
         project_pattern_dir = self.projects_dir / project_id
@@ -150,75 +322,194 @@ class PatternManager:
             "skipped": []
         }
         
+        due = []
         for pack_id, pack_info in self.community_sources.items():
             if not pack_info.get("enabled", True):
                 results["skipped"].append(pack_id)
                 continue
-            
+
             # Check if update is needed
             if not force and pack_info.get("last_updated"):
                 last_update = datetime.fromisoformat(pack_info["last_updated"])
                 if datetime.now() - last_update < timedelta(hours=24):
                     results["skipped"].append(pack_id)
                     continue
-            
-            try:
-                success = self._download_community_pack(pack_id, pack_info)
-                if success:
-                    results["updated"].append(pack_id)
-                    self.community_sources[pack_id]["last_updated"] = datetime.now().isoformat()
-                else:
-                    results["failed"].append(pack_id)
-            except Exception as e:
-                print(f"Error updating {pack_id}: {e}")
-                results["failed"].append(pack_id)
-        
+
+            due.append((pack_id, pack_info))
+
+        # Two-stage pipeline: downloads are network-bound and extraction is
+        # CPU/disk-bound, so while pack A converts on the extract pool the
+        # next download is already in flight. The download pool size caps
+        # concurrent transfers; bookkeeping happens back on this thread.
+        if due:
+            with ThreadPoolExecutor(max_workers=min(4, len(due))) as dl_pool, \
+                    ThreadPoolExecutor(max_workers=2) as extract_pool:
+                fetches = {
+                    dl_pool.submit(self._fetch_pack_archive, pack_id, pack_info): pack_id
+                    for pack_id, pack_info in due
+                }
+                converts = {}
+                for future in as_completed(fetches):
+                    pack_id = fetches[future]
+                    try:
+                        fetched = future.result()
+                    except Exception as e:
+                        print(f"Error updating {pack_id}: {e}")
+                        results["failed"].append(pack_id)
+                        continue
+                    if fetched is None:
+                        # 304 Not Modified; the extracted pack is current.
+                        results["updated"].append(pack_id)
+                        self.community_sources[pack_id]["last_updated"] = datetime.now().isoformat()
+                        continue
+                    temp_file, validators = fetched
+                    converts[extract_pool.submit(
+                        self._extract_and_convert, pack_id, temp_file)] = (pack_id, validators)
+
+                for future in as_completed(converts):
+                    pack_id, validators = converts[future]
+                    try:
+                        success = future.result()
+                    except Exception as e:
+                        print(f"Error updating {pack_id}: {e}")
+                        results["failed"].append(pack_id)
+                        continue
+                    if success:
+                        results["updated"].append(pack_id)
+                        pack_info = self.community_sources[pack_id]
+                        # Validators are recorded only now that the pack is
+                        # extracted; a failed run keeps the old ones so the
+                        # next attempt re-downloads.
+                        pack_info.update(validators)
+                        pack_info["last_updated"] = datetime.now().isoformat()
+                    else:
+                        results["failed"].append(pack_id)
+
         self._save_community_metadata()
+        if results["updated"]:
+            self._patterns_cache = None
+            self._bundle = None
         return results
     
     def _download_community_pack(self, pack_id: str, pack_info: Dict[str, Any]) -> bool:
         """Download and extract a community pattern pack."""
         try:
-            # Download the pack
-            response = requests.get(pack_info["url"], timeout=30)
-            response.raise_for_status()
-            
-            # Save to temporary file
-            temp_file = self.temp_dir / f"{pack_id}.zip"
-            with open(temp_file, 'wb') as f:
-                f.write(response.content)
-            
-            # Extract to community directory
-            pack_dir = self.community_dir / pack_id
-            if pack_dir.exists():
-                shutil.rmtree(pack_dir)
-            pack_dir.mkdir()
-            
-            with zipfile.ZipFile(temp_file, 'r') as zip_ref:
-                zip_ref.extractall(pack_dir)
-            
-            # Convert to our format if needed
-            self._convert_community_pack(pack_id, pack_dir)
-            
-            # Clean up
-            temp_file.unlink()
-            
-            return True
-            
+            fetched = self._fetch_pack_archive(pack_id, pack_info)
+            if fetched is None:
+                # Not modified upstream; keep the extracted pack as-is.
+                return True
+            temp_file, validators = fetched
+            if self._extract_and_convert(pack_id, temp_file):
+                pack_info.update(validators)
+                return True
+            return False
         except Exception as e:
             print(f"Error downloading {pack_id}: {e}")
             return False
-    
-    def _convert_community_pack(self, pack_id: str, pack_dir: Path):
+
+    def _fetch_pack_archive(self, pack_id: str, pack_info: Dict[str, Any]) -> Optional[tuple]:
+        """Download a pack archive to temp.
+
+        Returns (temp_file, validators) on a download, or None for a 304
+        Not Modified. The ETag/Last-Modified validators are returned to the
+        caller rather than written into pack_info here: they must only be
+        recorded once extraction succeeds, otherwise a failed pipeline
+        would get 304s forever for content that was never extracted.
+        """
+        # Ask the server to skip the transfer when the pack is unchanged
+        # since the last successful download. Only meaningful when the
+        # extracted pack is actually present on disk.
+        headers = {}
+        if (self.community_dir / pack_id).is_dir():
+            if pack_info.get("etag"):
+                headers["If-None-Match"] = pack_info["etag"]
+            if pack_info.get("last_modified"):
+                headers["If-Modified-Since"] = pack_info["last_modified"]
+
+        # Stream the pack straight to disk in 1MB chunks so peak memory
+        # stays constant instead of buffering the whole archive.
+        os.makedirs(self.temp_dir, exist_ok=True)
+        temp_file = self.temp_dir / f"{pack_id}.zip"
+        response = self._http.request(
+            "GET", pack_info["url"], headers=headers,
+            preload_content=False, timeout=30.0)
+        try:
+            if response.status == 304:
+                if not (self.community_dir / pack_id).is_dir():
+                    # Stale validators must not mask a missing pack.
+                    raise urllib3.exceptions.HTTPError(
+                        f"HTTP 304 for {pack_info['url']} but pack "
+                        f"{pack_id} is not extracted")
+                return None
+            if response.status >= 400:
+                raise urllib3.exceptions.HTTPError(
+                    f"HTTP {response.status} for {pack_info['url']}")
+            validators = {
+                "etag": response.headers.get("ETag"),
+                "last_modified": response.headers.get("Last-Modified"),
+            }
+            with open(temp_file, 'wb') as f:
+                for chunk in response.stream(1 << 20):
+                    f.write(chunk)
+        finally:
+            response.release_conn()
+        return temp_file, validators
+
+    def _extract_and_convert(self, pack_id: str, temp_file: Path) -> bool:
+        """Extract a downloaded archive and convert it to our format."""
+        # Build the pack in a staging directory and swap it in with
+        # rename() so concurrent readers never see a half-built pack.
+        # temp/ lives under the same patterns tree as community/, so the
+        # renames stay on one filesystem and are atomic.
+        pack_dir = self.community_dir / pack_id
+        new_dir = self.temp_dir / f"{pack_id}.new"
+        old_dir = self.temp_dir / f"{pack_id}.old"
+        for stale in (new_dir, old_dir):
+            if stale.exists():
+                shutil.rmtree(stale)
+        new_dir.mkdir()
+
+        with zipfile.ZipFile(temp_file, 'r') as zip_ref:
+            whitelist = _PACK_EXTRACT_WHITELIST.get(pack_id)
+            if whitelist is None:
+                zip_ref.extractall(new_dir)
+            elif whitelist:
+                # Only unpack the entries the converter will read.
+                for info in zip_ref.infolist():
+                    if any(fnmatch.fnmatch(info.filename, pat) for pat in whitelist):
+                        zip_ref.extract(info, new_dir)
+
+            # Convert while the archive is still open so converters can
+            # stream members in memory instead of reading extracted files.
+            self._convert_community_pack(pack_id, new_dir, zip_ref)
+
+        if pack_dir.exists():
+            os.rename(pack_dir, old_dir)
+        os.rename(new_dir, pack_dir)
+
+        # Tearing down the old tree can be slow; do it off the hot path.
+        if old_dir.exists():
+            threading.Thread(
+                target=shutil.rmtree, args=(old_dir,),
+                kwargs={"ignore_errors": True}, daemon=True).start()
+
+        # Clean up
+        temp_file.unlink()
+
+        return True
+
+
+    def _convert_community_pack(self, pack_id: str, pack_dir: Path,
+                                zip_ref: Optional[zipfile.ZipFile] = None):
         """Convert community pack to our JSON format."""
         if pack_id == "owasp-crs":
-            self._convert_owasp_crs(pack_dir)
+            self._convert_owasp_crs(pack_dir, zip_ref)
         elif pack_id == "nuclei-templates":
-            self._convert_nuclei_templates(pack_dir)
+            self._convert_nuclei_templates(pack_dir, zip_ref)
         elif pack_id == "security-patterns":
-            self._convert_security_patterns(pack_dir)
-    
-    def _convert_owasp_crs(self, pack_dir: Path):
+            self._convert_security_patterns(pack_dir, zip_ref)
+
+    def _convert_owasp_crs(self, pack_dir: Path, zip_ref: Optional[zipfile.ZipFile] = None):
         """Convert OWASP CRS rules to our format."""
         # This would convert ModSecurity rules to our JSON format
         # For now, create a placeholder
@@ -253,17 +544,25 @@ class PatternManager:
         }
         
         output_file = pack_dir / "converted_patterns.json"
-        with open(output_file, 'w') as f:
-            json.dump(converted_rules, f, indent=2)
+        _dump_json_file(output_file, converted_rules)
     
-    def _convert_nuclei_templates(self, pack_dir: Path):
+    def _convert_nuclei_templates(self, pack_dir: Path, zip_ref: Optional[zipfile.ZipFile] = None):
         """Convert Nuclei templates to our format."""
-        # This would convert YAML Nuclei templates to our JSON format
-        # For now, create a placeholder
+        # This would convert YAML Nuclei templates to our JSON format by
+        # streaming each template with zip_ref.open(info) — no intermediate
+        # files on disk. For now, create a placeholder and record how many
+        # templates the archive ships.
+        template_count = 0
+        if zip_ref is not None:
+            template_count = sum(
+                1 for info in zip_ref.infolist()
+                if info.filename.endswith((".yaml", ".yml"))
+            )
         converted_rules = {
             "name": "Nuclei Templates",
             "version": "latest",
             "description": "Converted ProjectDiscovery Nuclei security templates",
+            "template_count": template_count,
             "rules": [
                 {
                     "id": "nuclei_http_headers",
@@ -280,10 +579,9 @@ class PatternManager:
         }
         
         output_file = pack_dir / "converted_patterns.json"
-        with open(output_file, 'w') as f:
-            json.dump(converted_rules, f, indent=2)
+        _dump_json_file(output_file, converted_rules)
     
-    def _convert_security_patterns(self, pack_dir: Path):
+    def _convert_security_patterns(self, pack_dir: Path, zip_ref: Optional[zipfile.ZipFile] = None):
         """Convert OWASP security patterns to our format."""
         # This would convert conceptual security patterns to detection rules
         # For now, create a placeholder
@@ -295,68 +593,94 @@ class PatternManager:
         }
         
         output_file = pack_dir / "converted_patterns.json"
-        with open(output_file, 'w') as f:
-            json.dump(converted_rules, f, indent=2)
+        _dump_json_file(output_file, converted_rules)
     
-    def get_all_patterns(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
-        """Get all available patterns, optionally filtered by project."""
-        all_patterns = []
-        
-        # Add built-in patterns
+    def _make_patterns_cache_key(self, project_id: Optional[str]) -> Tuple[Optional[str], float]:
         builtin_dir = self.patterns_dir.parent / "patterns"
-        if builtin_dir.exists():
-            for pattern_file in builtin_dir.glob("*.json"):
-                try:
-                    with open(pattern_file, 'r', encoding='utf-8') as f:
-                        try:
-                            data = json.load(f)
-                        except json.JSONDecodeError as e:
-                            print(f"Warning: Could not load built-in pattern {pattern_file}: line {e.lineno} col {e.colno} — {e.msg}")
-                            continue
-                        if "rules" in data:
-                            for rule in data["rules"]:
-                                rule["pack_name"] = data.get("name", "Built-in")
-                                rule["pack_type"] = "builtin"
-                                all_patterns.append(rule)
-                except Exception as e:
-                    print(f"Warning: Could not open built-in pattern {pattern_file}: {e}")
-        
+        mtimes = []
+        for d in (builtin_dir, self.community_dir, self.projects_dir):
+            try:
+                mtimes.append(os.stat(d).st_mtime)
+            except OSError:
+                pass
+        return (project_id, max(mtimes, default=0.0))
+
+    def iter_all_patterns(self, project_id: Optional[str] = None):
+        """Yield every available pattern without materializing the full list.
+
+        Serves from the get_all_patterns cache when it is still warm.
+        """
+        if self._patterns_cache is not None and \
+                self._patterns_cache_key == self._make_patterns_cache_key(project_id):
+            yield from self._patterns_cache
+            return
+        yield from self._iter_patterns_uncached(project_id)
+
+    def _iter_patterns_uncached(self, project_id: Optional[str]):
+        builtin_dir = self.patterns_dir.parent / "patterns"
+        files = [("builtin", "Built-in", f) for f in _iter_json_files(builtin_dir)]
+
         # Add community patterns
-        for pack_dir in self.community_dir.iterdir():
-            if pack_dir.is_dir():
-                for pattern_file in pack_dir.glob("*.json"):
-                    try:
-                        with open(pattern_file, 'r', encoding='utf-8') as f:
-                            try:
-                                data = json.load(f)
-                            except json.JSONDecodeError as e:
-                                print(f"Warning: Could not load community pattern {pattern_file}: line {e.lineno} col {e.colno} — {e.msg}")
-                                continue
-                            if "rules" in data:
-                                for rule in data["rules"]:
-                                    rule["pack_name"] = data.get("name", "Community")
-                                    rule["pack_type"] = "community"
-                                    all_patterns.append(rule)
-                    except Exception as e:
-                        print(f"Warning: Could not open community pattern {pattern_file}: {e}")
-        
+        try:
+            pack_dirs = [e.path for e in os.scandir(self.community_dir) if e.is_dir()]
+        except OSError:
+            pack_dirs = []
+        for pack_dir in pack_dirs:
+            files.extend(("community", "Community", f) for f in _iter_json_files(pack_dir))
+
+        # Load files on a small pool to overlap read() latency; results are
+        # merged serially in submission order so output stays deterministic.
+        if len(files) > 1:
+            with ThreadPoolExecutor(max_workers=min(8, len(files))) as pool:
+                results = pool.map(_load_pattern_file, files)
+        else:
+            results = map(_load_pattern_file, files)
+
+        for (pack_type, default_name, pattern_file), data, error in results:
+            if error is not None:
+                print(f"Warning: Could not load {pack_type} pattern {pattern_file}: {error}")
+                continue
+            if "rules" in data:
+                for rule in data["rules"]:
+                    rule["pack_name"] = data.get("name", default_name)
+                    rule["pack_type"] = pack_type
+                    yield rule
+
         # Add project-specific patterns if specified
         if project_id:
             project_patterns = self.get_project_patterns(project_id)
             for rule in project_patterns:
                 rule["pack_type"] = "project"
-                all_patterns.append(rule)
-        
+                yield rule
+
+    def get_all_patterns(self, project_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """Get all available patterns, optionally filtered by project."""
+        # Serve from cache while the source directories are unchanged.
+        cache_key = self._make_patterns_cache_key(project_id)
+        if self._patterns_cache is not None and self._patterns_cache_key == cache_key:
+            return self._patterns_cache
+
+        all_patterns = list(self._iter_patterns_uncached(project_id))
+        self._patterns_cache = all_patterns
+        self._patterns_cache_key = cache_key
         return all_patterns
-    
+
+    def get_pattern_bundle(self, project_id: Optional[str] = None) -> PatternBundle:
+        """Pre-compiled columnar view of get_all_patterns, cached by mtime."""
+        cache_key = self._make_patterns_cache_key(project_id)
+        if self._bundle is not None and self._bundle_key == cache_key:
+            return self._bundle
+        self._bundle = PatternBundle(self.get_all_patterns(project_id))
+        self._bundle_key = cache_key
+        return self._bundle
+
     def validate_pattern(self, pattern: Dict[str, Any]) -> Tuple[bool, List[str]]:
         """Enhanced pattern validation with comprehensive checks."""
         errors = []
         warnings = []
         
         # Required fields validation
-        required_fields = ["id", "title", "regex"]
-        for field in required_fields:
+        for field in _REQUIRED_FIELDS:
             if not pattern.get(field):
                 errors.append(f"Missing required field: {field}")
         
@@ -387,23 +711,25 @@ class PatternManager:
                 errors.append("Regex must be a string")
             else:
                 try:
-                    import re
-                    compiled_regex = re.compile(regex, re.IGNORECASE)
-                    
-                    # Check for common regex issues
+                    _compile_ci(regex)
+
+                    # Check for common regex issues; order the cheap length
+                    # and slice tests first so the substring scans only run
+                    # when they can actually fire.
+                    regex_len = len(regex)
                     if regex.count("(") != regex.count(")"):
                         warnings.append("Unmatched parentheses in regex")
-                    
-                    if ".*" in regex and len(regex) < 10:
+
+                    if regex_len < 10 and ".*" in regex:
                         warnings.append("Very broad regex pattern may cause false positives")
-                    
-                    if regex.startswith(".*") and regex.endswith(".*"):
+
+                    if regex[:2] == ".*" and regex[-2:] == ".*":
                         warnings.append("Regex starts and ends with .* - consider anchoring")
-                    
+
                     # Check for performance issues
-                    if len(regex) > 500:
+                    if regex_len > 500:
                         warnings.append("Very long regex may impact performance")
-                        
+
                 except re.error as e:
                     errors.append(f"Invalid regex: {e}")
         
@@ -411,20 +737,11 @@ class PatternManager:
         cwe = pattern.get("cwe")
         if cwe:
             if isinstance(cwe, str):
-                # Normalize CWE format
-                cwe_normalized = cwe.upper().strip()
-                if not cwe_normalized.startswith("CWE-"):
-                    if cwe_normalized.isdigit():
-                        cwe_normalized = f"CWE-{cwe_normalized}"
-                    else:
-                        errors.append("CWE must be in format CWE-XXX or just the number")
-                
-                # Validate CWE number
-                cwe_num = cwe_normalized.replace("CWE-", "")
-                if not cwe_num.isdigit():
-                    errors.append("CWE number must be numeric")
+                m = _CWE_RE.match(cwe)
+                if not m:
+                    errors.append("CWE must be in format CWE-XXX or just the number")
                 else:
-                    cwe_int = int(cwe_num)
+                    cwe_int = int(m.group(1))
                     if cwe_int < 1 or cwe_int > 9999:
                         warnings.append("CWE number should be between 1 and 9999")
             else:
@@ -456,18 +773,13 @@ class PatternManager:
         
         # Severity validation
         severity = pattern.get("severity")
-        valid_severities = ["info", "low", "medium", "high", "critical"]
         if severity:
-            if severity not in valid_severities:
-                errors.append(f"Severity must be one of: {', '.join(valid_severities)}")
+            if severity not in _VALID_SEVERITY_SET:
+                errors.append(f"Severity must be one of: {', '.join(_VALID_SEVERITIES)}")
         
         # Where field validation
         where = pattern.get("where")
         if where:
-            valid_where_values = [
-                "request.body", "request.headers", "request.url", "request.params",
-                "response.body", "response.headers", "response.status"
-            ]
             if isinstance(where, str):
                 where_list = [where]
             elif isinstance(where, list):
@@ -475,10 +787,10 @@ class PatternManager:
             else:
                 errors.append("Where field must be a string or list of strings")
                 where_list = []
-            
+
             for w in where_list:
-                if w not in valid_where_values:
-                    warnings.append(f"Unknown 'where' value: {w}. Valid values: {', '.join(valid_where_values)}")
+                if w not in _VALID_WHERE_SET:
+                    warnings.append(f"Unknown 'where' value: {w}. Valid values: {', '.join(_VALID_WHERE_VALUES)}")
         
         # Tags validation
         tags = pattern.get("tags")
@@ -507,48 +819,56 @@ class PatternManager:
     
     def get_pattern_statistics(self) -> Dict[str, Any]:
         """Get comprehensive pattern statistics."""
-        all_patterns = self.get_all_patterns()
-        
-        stats = {
-            "total_patterns": len(all_patterns),
-            "by_pack_type": {},
-            "by_severity": {},
-            "by_cwe": {},
-            "by_confidence": {},
-            "enabled_count": 0,
-            "disabled_count": 0
-        }
-        
-        for pattern in all_patterns:
-            # Pack type
-            pack_type = pattern.get("pack_type", "unknown")
-            stats["by_pack_type"][pack_type] = stats["by_pack_type"].get(pack_type, 0) + 1
-            
-            # Severity
-            severity = pattern.get("severity", "info")
-            stats["by_severity"][severity] = stats["by_severity"].get(severity, 0) + 1
-            
-            # CWE
-            cwe = pattern.get("cwe")
+        if pd is not None and self._patterns_cache is not None \
+                and len(self._patterns_cache) >= _VECTORIZE_MIN_RULES:
+            return self._pattern_statistics_vectorized(self._patterns_cache)
+
+        total = enabled_count = 0
+        by_pack_type: Counter = Counter()
+        by_severity: Counter = Counter()
+        by_cwe: Counter = Counter()
+        by_confidence: Counter = Counter()
+
+        # Single pass over the generator keeps peak memory at one file's rules.
+        for p in self.iter_all_patterns():
+            total += 1
+            if p.get("enabled", True):
+                enabled_count += 1
+            by_pack_type[p.get("pack_type", "unknown")] += 1
+            by_severity[p.get("severity", "info")] += 1
+            cwe = p.get("cwe")
             if cwe:
-                stats["by_cwe"][cwe] = stats["by_cwe"].get(cwe, 0) + 1
-            
-            # Confidence ranges
-            confidence = pattern.get("confidence", 50)
-            if confidence >= 90:
-                conf_range = "90-100"
-            elif confidence >= 70:
-                conf_range = "70-89"
-            elif confidence >= 50:
-                conf_range = "50-69"
-            else:
-                conf_range = "0-49"
-            stats["by_confidence"][conf_range] = stats["by_confidence"].get(conf_range, 0) + 1
-            
-            # Enabled/disabled
-            if pattern.get("enabled", True):
-                stats["enabled_count"] += 1
-            else:
-                stats["disabled_count"] += 1
-        
-        return stats
+                by_cwe[cwe] += 1
+            by_confidence[_confidence_bin(p.get("confidence", 50))] += 1
+
+        return {
+            "total_patterns": total,
+            "by_pack_type": dict(by_pack_type),
+            "by_severity": dict(by_severity),
+            "by_cwe": dict(by_cwe),
+            "by_confidence": dict(by_confidence),
+            "enabled_count": enabled_count,
+            "disabled_count": total - enabled_count,
+        }
+
+    def _pattern_statistics_vectorized(self, all_patterns: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """C-level aggregation via pandas for large pattern sets."""
+        df = pd.DataFrame(all_patterns)
+        total = len(df)
+        enabled_count = int(df["enabled"].fillna(True).sum()) if "enabled" in df else total
+        confidence = df["confidence"].fillna(50) if "confidence" in df else pd.Series(50, index=df.index)
+        by_confidence = pd.cut(
+            confidence, bins=[-1, 49, 69, 89, 100],
+            labels=["0-49", "50-69", "70-89", "90-100"]).value_counts()
+        by_cwe = df["cwe"].dropna().value_counts() if "cwe" in df else pd.Series(dtype=int)
+
+        return {
+            "total_patterns": total,
+            "by_pack_type": df["pack_type"].fillna("unknown").value_counts().to_dict(),
+            "by_severity": df["severity"].fillna("info").value_counts().to_dict() if "severity" in df
+            else {"info": total},
+            "by_cwe": by_cwe.to_dict(),
+            "by_confidence": {k: int(v) for k, v in by_confidence.items() if v},
+            "enabled_count": enabled_count,
+            "disabled_count": total - enabled_count,
+        }
@@ -1,19 +1,29 @@
 from __future__ import annotations
 
+import atexit
 import hashlib
 import json
 import logging
 import os
 import re
+import sys
+import threading
 import time
-from dataclasses import asdict, dataclass, field
+import types
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, fields
 from datetime import datetime
-from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
+from enum import IntEnum
+from functools import cache
+from typing import Any, Callable, Dict, Iterable, List, NamedTuple, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
 from core import _json_safe, read_json, write_json
 from store import STORE_DIR
+from utils.findings_normalize import normalize_finding
 
 # Try to import cache decorator with fallback
 try:
@@ -38,11 +48,48 @@ FINDINGS_VERSION = "0.3"      # bump when schema changes
 def _findings_path(pid: str) -> str:
     return os.path.join(STORE_DIR, f"{pid}{FILENAME_SUFFIX}")
 
+# Write-through LRU of parsed findings keyed by pid. Entries carry the
+# file's mtime so writes from other processes are still noticed on read,
+# while our own writes prime the cache and skip the next parse entirely.
+# Rows are copied at the cache boundary in both directions: callers (the
+# UI backfills f["owasp"] in place, append_findings extends the list it
+# gets back) must never mutate the cached rows, and caller-owned dicts
+# must never become cache rows. Backfills only touch top-level keys, so
+# a per-row dict copy is enough.
+_FINDINGS_CACHE: "OrderedDict[str, Tuple[int, Tuple[Dict[str, Any], ...]]]" = OrderedDict()
+_FINDINGS_CACHE_MAX = 128
+
+def _cache_findings(pid: str, mtime_ns: int, rows: List[Dict[str, Any]]):
+    _FINDINGS_CACHE[pid] = (mtime_ns, tuple(dict(r) for r in rows))
+    _FINDINGS_CACHE.move_to_end(pid)
+    if len(_FINDINGS_CACHE) > _FINDINGS_CACHE_MAX:
+        _FINDINGS_CACHE.popitem(last=False)
+
 def _read_findings(pid: str) -> List[Dict[str, Any]]:
-    return read_json(_findings_path(pid), [])
+    if pid in _FINDINGS_BUFFER:
+        # Read-your-writes: drain anything analyze_and_record has
+        # buffered for this pid before serving the file contents.
+        flush_findings(pid)
+    path = _findings_path(pid)
+    try:
+        mtime_ns = os.stat(path).st_mtime_ns
+    except OSError:
+        return []
+    entry = _FINDINGS_CACHE.get(pid)
+    if entry is not None and entry[0] == mtime_ns:
+        _FINDINGS_CACHE.move_to_end(pid)
+        return [dict(r) for r in entry[1]]
+    rows = read_json(path, [])
+    _cache_findings(pid, mtime_ns, rows)
+    return rows
 
 def _write_findings(pid: str, rows: List[Dict[str, Any]]):
-    write_json(_findings_path(pid), rows)
+    path = _findings_path(pid)
+    write_json(path, rows)
+    try:
+        _cache_findings(pid, os.stat(path).st_mtime_ns, rows)
+    except OSError:
+        _FINDINGS_CACHE.pop(pid, None)
 
 def get_findings(pid: str) -> List[Dict[str, Any]]:
     return _read_findings(pid)
@@ -59,21 +106,23 @@ def count_findings_cached(pid: str) -> int:
     return len(_read_findings(pid))
 
 def clear_findings(pid: str):
+    with _BUFFER_LOCK:
+        _FINDINGS_BUFFER.pop(pid, None)
     _write_findings(pid, [])
     # Invalidate cache for this project
     invalidate_cache(f"count_findings_cached:('{pid}',)")
 
+_CVE_RE = re.compile(r'CVE-\d{4}-\d+')
+_CVE_PLACEHOLDERS = frozenset({'CVE-0000-0000', 'CVE-0000-0001', 'CVE-0000-0002'})
+
 def _is_valid_cve(cve_id: str) -> bool:
     """Check if CVE ID matches the valid pattern and is not a placeholder."""
-    if not cve_id or not isinstance(cve_id, str):
-        return False
-    # Check format and exclude placeholder
-    if not re.match(r'^CVE-\d{4}-\d+$', cve_id):
-        return False
-    # Exclude common placeholder values
-    if cve_id in ['CVE-0000-0000', 'CVE-0000-0001', 'CVE-0000-0002']:
-        return False
-    return True
+    return (
+        bool(cve_id)
+        and isinstance(cve_id, str)
+        and _CVE_RE.fullmatch(cve_id) is not None
+        and cve_id not in _CVE_PLACEHOLDERS
+    )
 
 def append_findings(pid: str, items: List[Dict[str, Any]]):
     if not items: return
@@ -109,11 +158,49 @@ def append_findings(pid: str, items: List[Dict[str, Any]]):
     except Exception as e:
         logger.warning(f"VULNS_CACHE_BUST_ERROR pid={pid} error={str(e)}")
 
+# Findings produced by analyze_and_record are buffered per pid and
+# appended in batches: each append is a read-modify-rewrite of the whole
+# findings file, so a burst of N analyzed responses used to cost N
+# rewrites. Buffers flush at _FLUSH_MAX_ITEMS, after _FLUSH_MAX_AGE
+# seconds, on read (see _read_findings) and at interpreter exit, so
+# nothing is lost and readers still see their own writes.
+_FLUSH_MAX_ITEMS = 256
+_FLUSH_MAX_AGE = 2.0   # seconds
+_FINDINGS_BUFFER: Dict[str, List[Dict[str, Any]]] = {}
+_LAST_FLUSH: Dict[str, float] = {}
+_BUFFER_LOCK = threading.Lock()
+
+def flush_findings(pid: Optional[str] = None) -> None:
+    """Append buffered findings to disk for one pid (or all pids)."""
+    batches: List[Tuple[str, List[Dict[str, Any]]]] = []
+    with _BUFFER_LOCK:
+        for p in [pid] if pid is not None else list(_FINDINGS_BUFFER):
+            batch = _FINDINGS_BUFFER.pop(p, None)
+            if batch:
+                batches.append((p, batch))
+                _LAST_FLUSH[p] = time.monotonic()
+    for p, batch in batches:
+        append_findings(p, batch)
+
+atexit.register(flush_findings)
+
+def _buffer_findings(pid: str, items: List[Dict[str, Any]]) -> None:
+    with _BUFFER_LOCK:
+        buf = _FINDINGS_BUFFER.setdefault(pid, [])
+        buf.extend(items)
+        now = time.monotonic()
+        if (len(buf) < _FLUSH_MAX_ITEMS
+                and now - _LAST_FLUSH.setdefault(pid, now) <= _FLUSH_MAX_AGE):
+            return
+        del _FINDINGS_BUFFER[pid]
+        _LAST_FLUSH[pid] = now
+    append_findings(pid, buf)
+
 # ============================================================
 # Finding model
 # ============================================================
 
-@dataclass
+@dataclass(slots=True)
 class Finding:
     # identity
     id: str
@@ -151,22 +238,55 @@ class Finding:
     res: Dict[str, Any] = field(default_factory=dict)
 
     def asdict(self) -> Dict[str, Any]:
-        return asdict(self)
+        # Shallow per-field build: dataclasses.asdict would deep-copy the
+        # req/res snapshots, which downstream consumers never mutate.
+        return {name: getattr(self, name) for name in _FINDING_FIELDS}
+
+_FINDING_FIELDS = tuple(f.name for f in fields(Finding))
 
 def _now_iso() -> str:
     return datetime.now().isoformat(timespec="seconds")
 
+def _ctx_ts(ctx: Dict[str, Any]) -> str:
+    """Per-response timestamp, read once and shared by every Finding;
+    datetime.now().isoformat() is too heavy to repeat per detector."""
+    ts = ctx.get("ts")
+    if ts is None:
+        ts = ctx["ts"] = _now_iso()
+    return ts
+
+# Per-pid hashers primed with the pid prefix: _mk_id is called for every
+# finding with the same pid over and over, so each call copies the primed
+# state instead of re-hashing the constant prefix.
+_PID_HASHERS: Dict[str, "hashlib.blake2b"] = {}
+
 def _mk_id(pid: str, detector_id: str, url: Optional[str], extra: Optional[str] = None) -> str:
-    h = hashlib.sha256()
-    h.update((pid or "-").encode())
-    h.update((detector_id or "-").encode())
-    h.update((url or "-").encode())
+    # Non-cryptographic dedup id: BLAKE2b at digest_size=8 yields the same
+    # 16 hex chars natively and is much cheaper than sha256 on short input.
+    pid = pid or "-"
+    base = _PID_HASHERS.get(pid)
+    if base is None:
+        base = hashlib.blake2b((pid.encode() + b"\x00"), digest_size=8)
+        _PID_HASHERS[pid] = base
+    h = base.copy()
+    tail = [(detector_id or "-").encode(), (url or "-").encode()]
     if extra:
-        h.update(extra.encode())
-    return h.hexdigest()[:16]
-
-def _snippet(text: str, limit: int = 240) -> str:
-    s = (text or "").replace("\r", " ").replace("\n", " ")
+        tail.append(extra.encode())
+    h.update(b"\x00".join(tail))
+    return h.hexdigest()
+
+def _snippet(text: str, limit: int = 240,
+             span: Optional[Tuple[int, int]] = None) -> str:
+    """Single-line excerpt of text; a match span windows the excerpt
+    around the hit instead of always snippeting from position 0."""
+    text = text or ""
+    if span is not None:
+        lo, hi = span
+        start = max(0, lo - 40)
+        end = min(len(text), hi + 80)
+        s = text[start:end].replace("\r", " ").replace("\n", " ")
+        return ("…" if start else "") + s + ("…" if end < len(text) else "")
+    s = text.replace("\r", " ").replace("\n", " ")
     return s[:limit] + ("…" if len(s) > limit else "")
 
 # ============================================================
@@ -174,14 +294,59 @@ def _snippet(text: str, limit: int = 240) -> str:
 # ============================================================
 
 DetectorFn = Callable[[Dict[str, Any], Dict[str, Any], Dict[str, Any]], Iterable[Finding]]
-_DETECTORS: List[Tuple[str, DetectorFn, Dict[str, Any]]] = []
-
-def register_detector(detector_id: str, **meta):
+# Parallel registration lists: the broadcast loop zips straight over
+# them with no per-detector tuple unpacking; targeted callers use the
+# id-keyed index instead of a linear scan.
+_DET_IDS: List[str] = []
+_DET_FNS: List[DetectorFn] = []
+_DET_META: List[Dict[str, Any]] = []
+_DET_NEEDS: List[Tuple[str, ...]] = []
+_DETECTORS_BY_ID: Dict[str, Tuple[DetectorFn, Dict[str, Any]]] = {}
+
+def register_detector(detector_id: str, needs: Tuple[str, ...] = (), **meta):
+    """Register a passive detector.
+
+    needs lists cheap preconditions ("body", "headers", "status_2xx")
+    checked before dispatch so inapplicable detectors are skipped without
+    a Python call.
+    """
     def _wrap(fn: DetectorFn):
-        _DETECTORS.append((detector_id, fn, meta))
+        _DET_IDS.append(detector_id)
+        _DET_FNS.append(fn)
+        _DET_META.append(meta)
+        _DET_NEEDS.append(needs)
+        _DETECTORS_BY_ID[detector_id] = (fn, meta)
         return fn
     return _wrap
 
+def get_detector(detector_id: str) -> Optional[Tuple[DetectorFn, Dict[str, Any]]]:
+    """O(1) lookup of a registered detector by its id."""
+    return _DETECTORS_BY_ID.get(detector_id)
+
+# Opt-in thread pool for the detector broadcast. Detectors are IO-free
+# and the regex/automaton scans they lean on run in C and release the
+# GIL on long bodies, so they can overlap across cores; on constrained
+# hosts leave the flag unset and dispatch stays sequential.
+_DET_POOL: Optional[ThreadPoolExecutor] = None
+_DET_POOL_LOCK = threading.Lock()
+
+def _parallel_detectors_enabled() -> bool:
+    return os.environ.get('ENABLE_PARALLEL_DETECTORS', '0') == '1'
+
+def _get_det_pool() -> ThreadPoolExecutor:
+    global _DET_POOL
+    if _DET_POOL is None:
+        with _DET_POOL_LOCK:
+            if _DET_POOL is None:
+                _DET_POOL = ThreadPoolExecutor(
+                    max_workers=min(8, os.cpu_count() or 1),
+                    thread_name_prefix="detector",
+                )
+    return _DET_POOL
+
+def _drain_detector(fn: DetectorFn, pre, res, ctx) -> List[Finding]:
+    return list(fn(pre, res, ctx) or ())
+
 # ============================================================
 # Helpers for detectors
 # ============================================================
@@ -204,44 +369,317 @@ _PII_PATTERNS = {
     "ssn": re.compile(r"\b\d{3}-\d{2}-\d{4}\b"),
 }
 
+_DIR_LISTING_MARKERS = ("<title>Index of /", "<h1>Index of /")
+
+# BOLA heuristic path shapes as plain segment sets: O(1) frozenset
+# membership per path segment instead of two regex engine passes.
+_ADMIN_SEGS = frozenset({"admin", "root", "superuser"})
+_OBJECT_SEGS = frozenset({
+    "user", "users", "account", "accounts", "order", "orders",
+    "item", "items", "profile", "profiles",
+})
+_HEX_ID_CHARS = frozenset("0123456789abcdefABCDEF-")
+
+def _object_id_like(seg: str) -> bool:
+    """Numeric id or UUID-ish (>=8 hex/dash chars) path segment."""
+    return seg.isdigit() or (len(seg) >= 8 and all(c in _HEX_ID_CHARS for c in seg))
+
+# Well-known rate-limit header names (lowercased): a few O(1) dict
+# lookups instead of a startswith scan over every response's headers.
+_RATE_LIMIT_CANDIDATES = (
+    "x-ratelimit-limit", "x-ratelimit-remaining", "x-ratelimit-reset",
+    "x-rate-limit-limit", "x-rate-limit-remaining", "x-rate-limit-reset",
+    "ratelimit-limit", "ratelimit-remaining", "ratelimit-reset",
+    "retry-after",
+)
+
+# Response bodies are truncated exactly once, in _build_res_obj;
+# detectors never re-slice. PII keeps its historical cap, which matches
+# the stored-body cap, so the fused scan reports identical hits.
+_RES_BODY_CAP = 8000
+_PII_SCAN_LIMIT = _RES_BODY_CAP
+
+# All body-scanning detector families fused into one alternation: a
+# single linear pass over the response body reports SQL errors, stack
+# traces, directory listings and PII instead of each detector
+# re-streaming the same bytes. Group names encode family + index
+# (s3 = 4th SQL pattern, p_email = PII email, ...); stack and dir
+# markers are case-sensitive literals, hence the scoped (?-i:...).
+# Subset variants let the scan drop whole families when their cheap
+# anchor prefilters say no pattern can match.
+def _compile_body_alt(include_sql: bool, include_pii: bool,
+                      include_literals: bool) -> Optional["re.Pattern[str]"]:
+    parts: List[str] = []
+    if include_sql:
+        parts += [f"(?P<s{i}>{p})" for i, p in enumerate(_SQL_ERROR_PATTERNS)]
+    if include_literals:
+        parts += [f"(?P<t{i}>(?-i:{re.escape(m)}))" for i, m in enumerate(_STACKTRACE_MARKERS)]
+        parts += [f"(?P<d{i}>(?-i:{re.escape(m)}))" for i, m in enumerate(_DIR_LISTING_MARKERS)]
+    if include_pii:
+        parts += [f"(?P<p_{name}>{rx.pattern})" for name, rx in _PII_PATTERNS.items()]
+    return re.compile("|".join(parts), re.IGNORECASE) if parts else None
+
+# Every SQL error pattern contains one of these (lower-cased); if none
+# occur in the body no SQL regex can match. PII needs an '@' or a digit.
+_SQL_ANCHORS = ("sql", "ora-", "syntax", "unclosed")
+_DIGIT_RE = re.compile(r"\d")
+
+# The stacktrace and directory-listing markers are fixed literals, so an
+# Aho-Corasick automaton (C-level multi-pattern DFA) finds all of them in
+# one pass when the optional pyahocorasick package is installed, beating
+# their branches of the regex alternation.
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+if ahocorasick is not None:
+    _LITERAL_AC = ahocorasick.Automaton()
+    for _marker in _STACKTRACE_MARKERS:
+        _LITERAL_AC.add_word(_marker, ("stack", _marker))
+    for _marker in _DIR_LISTING_MARKERS:
+        _LITERAL_AC.add_word(_marker, ("dir", _marker))
+    _LITERAL_AC.make_automaton()
+else:
+    _LITERAL_AC = None
+
+# Alternation variants keyed by (sql wanted, pii wanted); literal
+# branches are covered by the automaton when it is present.
+_BODY_ALTS: Dict[Tuple[bool, bool], Optional["re.Pattern[str]"]] = {
+    (_s, _p): _compile_body_alt(_s, _p, _LITERAL_AC is None)
+    for _s in (False, True)
+    for _p in (False, True)
+}
+
+# Hyperscan, when the optional python-hyperscan package is installed,
+# compiles the whole body-scanning family set into one SIMD database;
+# the fused alternation above stays as the fallback. Ids index into
+# _BODY_PATTERN_MAP, which routes each hit back to its family.
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
+_BODY_PATTERN_MAP: List[Tuple[str, str]] = (
+    [("sql", p) for p in _SQL_ERROR_PATTERNS]
+    + [("stack", m) for m in _STACKTRACE_MARKERS]
+    + [("dir", m) for m in _DIR_LISTING_MARKERS]
+    + [("pii", name) for name in _PII_PATTERNS]
+)
+
+_BODY_HS_DB = None
+_BODY_HS_LOCK = threading.Lock()
+if hyperscan is not None:
+    try:
+        _exprs = []
+        _flags = []
+        for _family, _payload in _BODY_PATTERN_MAP:
+            if _family == "sql":
+                _exprs.append(_payload.encode("utf-8"))
+                _flags.append(hyperscan.HS_FLAG_CASELESS | hyperscan.HS_FLAG_SINGLEMATCH)
+            elif _family == "pii":
+                _exprs.append(_PII_PATTERNS[_payload].pattern.encode("utf-8"))
+                # Per-match end offsets are needed for the PII scan cap.
+                _flags.append(hyperscan.HS_FLAG_CASELESS)
+            else:  # case-sensitive literals (stack traces, dir listings)
+                _exprs.append(re.escape(_payload).encode("utf-8"))
+                _flags.append(hyperscan.HS_FLAG_SINGLEMATCH)
+        _db = hyperscan.Database()
+        _db.compile(expressions=_exprs, ids=list(range(len(_exprs))), flags=_flags)
+        _BODY_HS_DB = _db
+    except Exception:
+        _BODY_HS_DB = None
+
+
+def _scan_body_families(body: str) -> Dict[str, Any]:
+    """One linear pass over body shared by every body-scanning detector.
+
+    Returns {"sql": [(pattern, span)...], "stack": [(marker, span)...],
+    "dir_listing": span-or-None, "pii": {kind: span}} with each list in
+    first-hit order and free of duplicates; spans are (start, end)
+    offsets into body so evidence snippets can window around the hit.
+    """
+    sql: List[Tuple[str, Tuple[int, int]]] = []
+    stack: List[Tuple[str, Tuple[int, int]]] = []
+    pii: Dict[str, Tuple[int, int]] = {}
+    dir_listing: Optional[Tuple[int, int]] = None
+    seen: set = set()
+
+    if _BODY_HS_DB is not None:
+        hits: List[Tuple[int, int]] = []  # (pattern id, end offset)
+        with _BODY_HS_LOCK:  # scratch space is not thread-safe
+            _BODY_HS_DB.scan(
+                body.encode("utf-8", "ignore"),
+                match_event_handler=lambda pat_id, _s, end, _f, _c: hits.append((pat_id, end)),
+            )
+        for pat_id, end in hits:
+            family, payload = _BODY_PATTERN_MAP[pat_id]
+            if family == "pii":
+                # Hyperscan reports end offsets only (no SOM), so the
+                # span degenerates to the match end.
+                if end <= _PII_SCAN_LIMIT:
+                    pii.setdefault(payload, (end, end))
+            elif pat_id not in seen:
+                seen.add(pat_id)
+                if family == "sql":
+                    sql.append((payload, (end, end)))
+                elif family == "stack":
+                    stack.append((payload, (end - len(payload), end)))
+                elif dir_listing is None:
+                    dir_listing = (end - len(payload), end)
+    else:
+        if _LITERAL_AC is not None:
+            # Literal markers go through the C-level automaton instead
+            # of the alternation branches when pyahocorasick is present.
+            for _end, (family, marker) in _LITERAL_AC.iter(body):
+                if family == "dir":
+                    if dir_listing is None:
+                        dir_listing = (_end - len(marker) + 1, _end + 1)
+                elif marker not in seen:
+                    seen.add(marker)
+                    stack.append((marker, (_end - len(marker) + 1, _end + 1)))
+        # Cheap substring anchors gate the expensive families: most
+        # bodies contain none, so their branches drop out of the scan.
+        body_lc = body.lower()
+        want_sql = any(a in body_lc for a in _SQL_ANCHORS)
+        want_pii = "@" in body or _DIGIT_RE.search(body, 0, _PII_SCAN_LIMIT) is not None
+        alt = _BODY_ALTS[(want_sql, want_pii)]
+        if alt is None:
+            return {"sql": sql, "stack": stack, "dir_listing": dir_listing, "pii": pii}
+        for m in alt.finditer(body):
+            g = m.lastgroup
+            if g is None:
+                continue
+            kind = g[0]
+            if kind == "p":
+                if m.end() <= _PII_SCAN_LIMIT:
+                    pii.setdefault(g[2:], m.span())
+            elif kind in ("t", "d"):
+                if _LITERAL_AC is None and g not in seen:
+                    seen.add(g)
+                    if kind == "t":
+                        stack.append((_STACKTRACE_MARKERS[int(g[1:])], m.span()))
+                    elif dir_listing is None:
+                        dir_listing = m.span()
+            elif g not in seen:
+                seen.add(g)
+                sql.append((_SQL_ERROR_PATTERNS[int(g[1:])], m.span()))
+
+    return {"sql": sql, "stack": stack, "dir_listing": dir_listing, "pii": pii}
+
+
+def _body_scan(res: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """Fused body scan, computed once per response and cached on ctx."""
+    scan = ctx.get("_body_scan")
+    if scan is None:
+        scan = _scan_body_families(res.get("body") or "")
+        ctx["_body_scan"] = scan
+    return scan
+
+def _body_cf(res: Dict[str, Any], ctx: Dict[str, Any]) -> str:
+    """Casefolded body, computed once per response and cached on ctx."""
+    body_cf = ctx.get("_body_cf")
+    if body_cf is None:
+        body_cf = (res.get("body") or "").casefold()
+        ctx["_body_cf"] = body_cf
+    return body_cf
+
 def _lower_headers(hdrs: Optional[Dict[str, Any]]) -> Dict[str, str]:
-    out: Dict[str, str] = {}
-    for k, v in (hdrs or {}).items():
-        try:
-            out[str(k).lower()] = str(v)
-        except Exception:
-            pass
-    return out
+    if not hdrs:
+        return {}
+    try:
+        # Well-formed headers (the overwhelmingly common case): one
+        # C-level comprehension instead of a try/except per key.
+        return {str(k).lower(): str(v) for k, v in hdrs.items()}
+    except Exception:
+        out: Dict[str, str] = {}
+        for k, v in hdrs.items():
+            try:
+                out[str(k).lower()] = str(v)
+            except Exception:
+                pass
+        return out
+
+def _res_headers_lc(res: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, str]:
+    """Lower-cased response headers, computed once per response via ctx."""
+    hdrs = ctx.get("res_headers_lc")
+    if hdrs is None:
+        hdrs = _lower_headers(res.get("headers"))
+        ctx["res_headers_lc"] = hdrs
+    return hdrs
+
+def _req_headers_lc(pre: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, str]:
+    """Lower-cased request headers, computed once per request via ctx."""
+    hdrs = ctx.get("req_headers_lc")
+    if hdrs is None:
+        hdrs = _lower_headers(pre.get("headers"))
+        ctx["req_headers_lc"] = hdrs
+    return hdrs
+
+# (source label, request field) pairs scanned for injectable string tokens.
+_TOKEN_SOURCES = (
+    ("query", "query"),
+    ("json", "json"),
+    ("form", "data"),
+    ("cookies", "cookies"),
+    ("headers", "headers"),
+)
 
 def _iter_request_string_tokens(pre: Dict[str, Any]) -> Iterable[Tuple[str, Optional[str], str]]:
     # source, key, token
-    for source, obj in (("query", pre.get("query")),
-                        ("json", pre.get("json")),
-                        ("form", pre.get("data") if isinstance(pre.get("data"), dict) else None),
-                        ("cookies", pre.get("cookies")),
-                        ("headers", pre.get("headers"))):
+    # Exact-type checks: these values come from parsed JSON, which only
+    # ever produces plain dict/list, so the isinstance MRO walk is waste.
+    get = pre.get
+    for source, field in _TOKEN_SOURCES:
+        obj = get(field)
         if not obj:
             continue
-        if isinstance(obj, dict):
+        if type(obj) is dict:
             for k, v in obj.items():
                 for tok in _iter_string_tokens(v):
                     yield source, k, tok
-        else:
+        elif source != "form":  # raw (non-dict) bodies are not token sources
             for tok in _iter_string_tokens(obj):
                 yield source, None, tok
 
+def _req_tokens(pre: Dict[str, Any], ctx: Dict[str, Any]) -> List[Tuple[str, Optional[str], str, str]]:
+    """Deduped (source, name, token, token_casefold) tuples for a request.
+
+    Enumerated once per analyze pass and cached on ctx so every consumer
+    of request tokens shares the filtered list.
+    """
+    toks = ctx.get("req_tokens")
+    if toks is None:
+        toks = []
+        seen = set()
+        for source, name, tok in _iter_request_string_tokens(pre):
+            if not _ok_token(tok):
+                continue
+            tok_cf = tok.casefold()
+            key = (source, name, tok_cf)
+            if key in seen:
+                continue
+            seen.add(key)
+            toks.append((source, name, tok, tok_cf))
+        ctx["req_tokens"] = toks
+    return toks
+
 def _iter_string_tokens(value: Any, max_len: int = 150):
+    # Iterative traversal: no nested generator frames or yield-from
+    # forwarding per nesting level. The reversed extends keep tokens in
+    # the same depth-first order the recursive version produced.
+    stack = [value]
     try:
-        if isinstance(value, str):
-            v = value.strip()
-            if v and len(v) <= max_len:
-                yield v
-        elif isinstance(value, dict):
-            for _, v in value.items():
-                yield from _iter_string_tokens(v, max_len)
-        elif isinstance(value, list):
-            for v in value:
-                yield from _iter_string_tokens(v, max_len)
+        while stack:
+            v = stack.pop()
+            if type(v) is str:
+                s = v.strip()
+                if s and len(s) <= max_len:
+                    yield s
+            elif type(v) is dict:
+                stack.extend(reversed(v.values()))
+            elif type(v) is list:
+                stack.extend(reversed(v))
     except Exception:
         return
 
@@ -253,21 +691,125 @@ def _ok_token(t: str) -> bool:
     if low in {"true", "false", "null", "none"}: return False
     return any(c.isalpha() for c in t)
 
+# Ranked by priority; lower rank wins when a token reflects in several spots.
+_XSS_CONTEXT_RANKS: Tuple[Tuple[str, str], ...] = (
+    ("script", "high"),
+    ("event_attr", "high"),
+    ("url_attr", "medium"),
+    ("attr", "medium"),
+    ("text", "low"),
+)
+
+_WS = " \t\r\n"
+
+
+def _scan_html_contexts(html: str, lower: Optional[str] = None) -> List[Tuple[int, int, int]]:
+    """Single-pass HTML scan returning (start, end, rank) context spans.
+
+    One left-to-right traversal with str.find tracks script bodies, quoted
+    attribute values (event handlers, href/src, other attributes), and text
+    nodes. Spans are non-overlapping and sorted by start, so classifying a
+    token is a bisect instead of a backtracking regex over the whole body.
+    """
+    if lower is None:
+        lower = html.lower()
+    spans: List[Tuple[int, int, int]] = []
+    n = len(html)
+    i = 0
+    while i < n:
+        lt = lower.find("<", i)
+        if lt == -1:
+            break
+        if lower.startswith("<script", lt):
+            open_end = lower.find(">", lt)
+            if open_end == -1:
+                break
+            close = lower.find("</script", open_end + 1)
+            if close == -1:
+                spans.append((open_end + 1, n, 0))
+                break
+            spans.append((open_end + 1, close, 0))
+            gt = lower.find(">", close)
+            i = n if gt == -1 else gt + 1
+            continue
+        gt = lower.find(">", lt)
+        if gt == -1:
+            break
+        # Quoted attribute values inside this tag.
+        j = lt
+        while True:
+            eq = html.find("=", j, gt)
+            if eq == -1:
+                break
+            k = eq - 1
+            while k > lt and html[k] in _WS:
+                k -= 1
+            name_end = k + 1
+            while k > lt and (html[k].isalnum() or html[k] in "-_"):
+                k -= 1
+            name = lower[k + 1:name_end]
+            v = eq + 1
+            while v < gt and html[v] in _WS:
+                v += 1
+            if v < gt and html[v] in "'\"":
+                vend = html.find(html[v], v + 1, gt)
+                if vend == -1:
+                    vend = gt
+                if name.startswith("on"):
+                    rank = 1
+                elif name in ("href", "src"):
+                    rank = 2
+                else:
+                    rank = 3
+                spans.append((v + 1, vend, rank))
+                j = vend + 1
+            else:
+                j = eq + 1
+        # Text node between this tag and the next one.
+        nxt = lower.find("<", gt + 1)
+        text_end = n if nxt == -1 else nxt
+        if text_end > gt + 1:
+            spans.append((gt + 1, text_end, 4))
+        i = gt + 1
+    return spans
+
+
+# One-slot scan cache: the reflection detector classifies many tokens
+# against the same response body back to back.
+_HTML_SCAN_CACHE: Optional[Tuple[str, str, List[int], List[Tuple[int, int, int]]]] = None
+
+
+def _html_scan(html: str) -> Tuple[str, List[int], List[Tuple[int, int, int]]]:
+    global _HTML_SCAN_CACHE
+    cached = _HTML_SCAN_CACHE
+    if cached is not None and (cached[0] is html or cached[0] == html):
+        return cached[1], cached[2], cached[3]
+    lower = html.lower()
+    spans = _scan_html_contexts(html, lower)
+    starts = [s[0] for s in spans]
+    _HTML_SCAN_CACHE = (html, lower, starts, spans)
+    return lower, starts, spans
+
 def _classify_html_context(html: str, token: str) -> Tuple[str, str]:
     # context, severity
+    best = len(_XSS_CONTEXT_RANKS)
     try:
-        if re.search(r"<script[^>]*>[\s\S]*?" + re.escape(token) + r"[\s\S]*?</script>", html, re.I):
-            return "script", "high"
-        if re.search(r"on\w+\s*=\s*(['\"]).*?" + re.escape(token) + r".*?\1", html, re.I):
-            return "event_attr", "high"
-        if re.search(r"\b(href|src)\s*=\s*(['\"]).*?" + re.escape(token) + r".*?\2", html, re.I):
-            return "url_attr", "medium"
-        if re.search(r"<[^>]+?=\s*(['\"]).*?" + re.escape(token) + r".*?\1", html, re.I):
-            return "attr", "medium"
-        if re.search(r">[^<]*?" + re.escape(token) + r"[^<]*?<", html):
-            return "text", "low"
+        lower, starts, spans = _html_scan(html)
+        tl = token.lower()
+        pos = lower.find(tl)
+        while pos != -1:
+            idx = bisect_right(starts, pos) - 1
+            if idx >= 0 and pos < spans[idx][1]:
+                rank = spans[idx][2]
+                if rank == 0:
+                    return _XSS_CONTEXT_RANKS[0]
+                if rank < best:
+                    best = rank
+            pos = lower.find(tl, pos + len(tl))
     except Exception:
         pass
+    if best < len(_XSS_CONTEXT_RANKS):
+        return _XSS_CONTEXT_RANKS[best]
     return "unknown", "low"
 
 # ============================================================
@@ -276,62 +818,63 @@ def _classify_html_context(html: str, token: str) -> Tuple[str, str]:
 
 @register_detector(
     "sql_error",
+    needs=("body",),
     owasp="A03:2021-Injection",
     cwe="CWE-89"
 )
 def det_sql_error(pre, res, ctx):
     body = res.get("body") or ""
-    for pat in _SQL_ERROR_PATTERNS:
-        if re.search(pat, body, re.I):
-            yield Finding(
+    for pat, span in _body_scan(res, ctx)["sql"]:
+        yield Finding(
                 id=_mk_id(ctx["pid"], "sql_error", pre.get("url"), pat),
-                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
                 detector_id="sql_error", title="SQL error pattern in response",
                 severity="high", owasp="A03:2021-Injection", cwe="CWE-89",
                 detail=f"Matched pattern: {pat}",
-                evidence=_snippet(body),
+                evidence=_snippet(body, span=span),
                 subcategory="SQL error leaked",
                 match=pat, method=pre.get("method"), url=pre.get("url"),
-                status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+                status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
                 tags=["error", "db", "injection"],
                 confidence=85  # High confidence for SQL error patterns
             )
 
 @register_detector(
     "stacktrace",
+    needs=("body",),
     owasp="A05:2021-Security Misconfiguration",
     cwe="CWE-209"
 )
 def det_stacktrace(pre, res, ctx):
     body = res.get("body") or ""
-    for m in _STACKTRACE_MARKERS:
-        if m in body:
-            yield Finding(
-                id=_mk_id(ctx["pid"], "stacktrace", pre.get("url"), m),
-                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
-                detector_id="stacktrace", title="Stack trace leaked in response",
-                severity="medium", owasp="A05:2021-Security Misconfiguration", cwe="CWE-209",
-                detail=f"Found marker: {m}",
-                evidence=_snippet(body),
-                subcategory="Debug stack trace leaked",
-                match=m, method=pre.get("method"), url=pre.get("url"),
-                status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
-                tags=["error", "debug"]
-            )
+    for m, span in _body_scan(res, ctx)["stack"]:
+        yield Finding(
+            id=_mk_id(ctx["pid"], "stacktrace", pre.get("url"), m),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
+            detector_id="stacktrace", title="Stack trace leaked in response",
+            severity="medium", owasp="A05:2021-Security Misconfiguration", cwe="CWE-209",
+            detail=f"Found marker: {m}",
+            evidence=_snippet(body, span=span),
+            subcategory="Debug stack trace leaked",
+            match=m, method=pre.get("method"), url=pre.get("url"),
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
+            tags=["error", "debug"]
+        )
 
 @register_detector(
     "cors_star_with_credentials",
+    needs=("headers",),
     owasp="A05:2021-Security Misconfiguration",
     cwe="CWE-346"
 )
 def det_cors_misconfig(pre, res, ctx):
-    hdrs = _lower_headers(res.get("headers"))
+    hdrs = _res_headers_lc(res, ctx)
     acao = (hdrs.get("access-control-allow-origin") or "").strip()
     acac = (hdrs.get("access-control-allow-credentials") or "").strip().lower()
     if acao == "*" and acac == "true":
         yield Finding(
             id=_mk_id(ctx["pid"], "cors_star_with_credentials", pre.get("url")),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="cors_star_with_credentials",
             title="CORS misconfiguration: '*' with credentials",
             severity="high", owasp="A05:2021-Security Misconfiguration", cwe="CWE-346",
@@ -339,12 +882,13 @@ def det_cors_misconfig(pre, res, ctx):
             evidence=f"ACAO={acao}, ACAC={acac}",
             subcategory="CORS: * + credentials",
             method=pre.get("method"), url=pre.get("url"),
-            status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["cors", "misconfig"]
         )
 
 @register_detector(
     "sec_headers_missing",
+    needs=("headers",),
     owasp="A05:2021-Security Misconfiguration",
     cwe="CWE-693"
 )
@@ -367,25 +911,26 @@ def det_security_headers(pre, res, ctx):
         sev = "medium" if any(x in core for x in missing) else "low"
         yield Finding(
             id=_mk_id(ctx["pid"], "sec_headers_missing", pre.get("url"), ",".join(missing)),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="sec_headers_missing",
             title="Missing recommended security headers",
             severity=sev, owasp="A05:2021-Security Misconfiguration",
             detail="Missing: " + ", ".join(missing),
             evidence="", subcategory="Security headers missing",
             method=pre.get("method"), url=pre.get("url"),
-            status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["headers", "hardening"],
             confidence=80  # High confidence for missing headers
         )
 
 @register_detector(
     "server_tech_disclosure",
+    needs=("headers",),
     owasp="A05:2021-Security Misconfiguration",
     cwe="CWE-200"
 )
 def det_server_tech_disclosure(pre, res, ctx):
-    hdrs = _lower_headers(res.get("headers"))
+    hdrs = _res_headers_lc(res, ctx)
     leaks = []
     if "server" in hdrs and hdrs["server"].strip():
         leaks.append(f"Server: {hdrs['server']}")
@@ -394,7 +939,7 @@ def det_server_tech_disclosure(pre, res, ctx):
     if leaks:
         yield Finding(
             id=_mk_id(ctx["pid"], "server_tech_disclosure", pre.get("url"), ";".join(leaks)),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="server_tech_disclosure",
             title="Server technology disclosed in headers",
             severity="low", owasp="A05:2021-Security Misconfiguration", cwe="CWE-200",
@@ -402,60 +947,60 @@ def det_server_tech_disclosure(pre, res, ctx):
             evidence="",
             subcategory="Server header disclosed",
             method=pre.get("method"), url=pre.get("url"),
-            status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["info-leak", "headers"]
         )
 
 @register_detector(
     "dir_listing",
+    needs=("body",),
     owasp="A01:2021-Broken Access Control",
     cwe="CWE-548"
 )
 def det_dir_listing(pre, res, ctx):
     body = res.get("body") or ""
-    if "<title>Index of /" in body or "<h1>Index of /" in body:
+    span = _body_scan(res, ctx)["dir_listing"]
+    if span:
         yield Finding(
             id=_mk_id(ctx["pid"], "dir_listing", pre.get("url")),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="dir_listing", title="Directory listing exposed",
             severity="low", owasp="A05:2021-Security Misconfiguration", cwe="CWE-548",
             detail="Index of / detected",
-            evidence=_snippet(body), subcategory="Directory listing enabled",
+            evidence=_snippet(body, span=span), subcategory="Directory listing enabled",
             method=pre.get("method"), url=pre.get("url"),
-            status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["listing"]
         )
 
 @register_detector(
     "reflected_input",
+    needs=("body",),
     owasp="A03:2021-Injection",
     cwe="CWE-79"
 )
 def det_reflection(pre, res, ctx):
     body = res.get("body") or ""
     ctype = (res.get("content_type") or "").lower()
-    # collect candidate tokens from request
-    seen = set()
-    for source, name, tok in _iter_request_string_tokens(pre):
-        if not _ok_token(tok): continue
-        key = (source, name, tok.lower())
-        if key in seen: continue
-        seen.add(key)
-
-        if tok.lower() not in body.lower():
+    # One casefold per response, shared via ctx; the old code
+    # re-lowercased the whole body for every candidate token.
+    body_cf = _body_cf(res, ctx)
+    # candidate tokens are enumerated once per request and shared via ctx
+    for source, name, tok, tok_cf in _req_tokens(pre, ctx):
+        if tok_cf not in body_cf:
             continue
 
         if "application/json" in ctype:
             yield Finding(
                 id=_mk_id(ctx["pid"], "reflected_input", pre.get("url"), tok),
-                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
                 detector_id="reflected_input",
                 title="Input reflected in JSON response",
                 severity="low", owasp="A03:2021-Injection", cwe="CWE-200",
                 detail=f"{source} parameter '{name}' value echoed (JSON)",
                 evidence=_snippet(tok), subcategory="Reflection (JSON)", match=tok,
                 method=pre.get("method"), url=pre.get("url"),
-                status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+                status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
                 tags=["reflection", "json"],
                 confidence=75  # High confidence for JSON reflection
             )
@@ -463,46 +1008,45 @@ def det_reflection(pre, res, ctx):
             ctx_name, sev = _classify_html_context(body, tok)
             yield Finding(
                 id=_mk_id(ctx["pid"], "reflected_input", pre.get("url"), tok + ":" + ctx_name),
-                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+                pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
                 detector_id="reflected_input",
                 title="Reflected input in response",
                 severity=sev, owasp="A03:2021-Injection", cwe="CWE-79",
                 detail=f"{source} parameter '{name}' value reflected ({ctx_name})",
                 evidence=_snippet(tok), subcategory=f"Reflection ({ctx_name})", match=tok,
                 method=pre.get("method"), url=pre.get("url"),
-                status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+                status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
                 tags=["reflection", ctx_name],
                 confidence=80  # High confidence for HTML reflection
             )
 
 @register_detector(
     "pii_disclosure",
+    needs=("body",),
     owasp="A02:2021-Cryptographic Failures",
     cwe="CWE-359"
 )
 def det_pii(pre, res, ctx):
-    body = (res.get("body") or "")[:8000]
-    hits = []
-    for name, rx in _PII_PATTERNS.items():
-        if rx.search(body):
-            hits.append(name)
+    body = res.get("body") or ""
+    hits = _body_scan(res, ctx)["pii"]
     if hits:
         yield Finding(
             id=_mk_id(ctx["pid"], "pii_disclosure", pre.get("url"), ",".join(sorted(set(hits)))),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="pii_disclosure",
             title="Potential PII disclosed in response",
             severity="medium", owasp="A02:2021-Cryptographic Failures", cwe="CWE-359",
             detail="Detected patterns: " + ", ".join(sorted(set(hits))),
-            evidence=_snippet(body),
+            evidence=_snippet(body, span=min(hits.values())),
             subcategory="PII patterns observed",
             method=pre.get("method"), url=pre.get("url"),
-            status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["pii", "data-exposure"]
         )
 
 @register_detector(
     "api_auth_bola_heuristic",
+    needs=("status_2xx",),
     owasp_api="API1:2023-Broken Object Level Authorization",
     cwe="CWE-639"
 )
@@ -514,49 +1058,53 @@ def det_api_bola_heuristic(pre, res, ctx):
     url = pre.get("url") or ""
     method = (pre.get("method") or "").upper()
     status = res.get("status") or 0
-    hdrs = _lower_headers(pre.get("headers"))
+    hdrs = _req_headers_lc(pre, ctx)
     has_auth = "authorization" in hdrs or "cookie" in hdrs  # crude
     path = url.split("?", 1)[0]
 
-    looks_object = re.search(r"/(users?|accounts?|orders?|items?|profiles?)/(\d+|[0-9a-fA-F-]{8,})\b", path)
-    adminish = re.search(r"/(admin|root|superuser)\b", path)
+    segs = path.split("/")
+    adminish = any(s in _ADMIN_SEGS for s in segs)
+    looks_object = any(
+        segs[i] in _OBJECT_SEGS and _object_id_like(segs[i + 1])
+        for i in range(len(segs) - 1)
+    )
 
     if method in {"GET","PUT","PATCH","DELETE"} and status and 200 <= status < 300 and not has_auth and (looks_object or adminish):
         sev = "medium" if adminish else "low"
         yield Finding(
             id=_mk_id(ctx["pid"], "api_auth_bola_heuristic", url, method),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="api_auth_bola_heuristic",
             title="Possibly unprotected object endpoint (heuristic)",
             severity=sev, owasp_api="API1:2023-BOLA", cwe="CWE-639",
             detail="2xx on object-like or admin path without Authorization header",
             evidence=path, subcategory="Possibly unprotected object endpoint",
             method=method, url=url, status=status,
-            req=ctx["req_obj"], res=ctx["res_obj"],
+            req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["auth", "bola", "heuristic"],
             confidence=60  # Medium confidence for BOLA heuristic
         )
 
 @register_detector(
     "api_rate_limit_headers_missing",
+    needs=("headers",),
     owasp_api="API9:2023-Imprecise Rate Limiting",
     cwe="CWE-770"
 )
 def det_rate_limit_headers(pre, res, ctx):
     # Purely informational: warn when common RL headers are absent.
-    hdrs = _lower_headers(res.get("headers"))
-    keys = [k for k in hdrs.keys() if k.startswith("x-ratelimit") or k in {"retry-after"}]
-    if not keys:
+    hdrs = _res_headers_lc(res, ctx)
+    if not any(k in hdrs for k in _RATE_LIMIT_CANDIDATES):
         yield Finding(
             id=_mk_id(ctx["pid"], "api_rate_limit_headers_missing", pre.get("url")),
-            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_now_iso(),
+            pid=ctx["pid"], version=FINDINGS_VERSION, ts=_ctx_ts(ctx),
             detector_id="api_rate_limit_headers_missing",
             title="No rate limiting headers observed",
             severity="info", owasp_api="API9:2023-Imprecise Rate Limiting",
             detail="Common rate limit headers (X-RateLimit-*, Retry-After) not present",
             evidence="", subcategory="Rate limiting headers missing",
             method=pre.get("method"), url=pre.get("url"),
-            status=res.get("status"), req=ctx["req_obj"], res=ctx["res_obj"],
+            status=res.get("status"), req=_req_obj(pre, ctx), res=ctx["res_obj"],
             tags=["rate-limit", "observability"],
             confidence=70  # Medium confidence for missing rate limit headers
         )
@@ -576,6 +1124,15 @@ def _build_req_obj(pre: Dict[str, Any]) -> Dict[str, Any]:
         "data": _json_safe(pre.get("data")),
     }
 
+def _req_obj(pre: Dict[str, Any], ctx: Dict[str, Any]) -> Dict[str, Any]:
+    """Request object for Finding.req, built on first use and cached on
+    ctx. Most responses emit no findings, so the _json_safe traversals
+    of headers/query/cookies/json/data never run for them."""
+    obj = ctx.get("req_obj")
+    if obj is None:
+        obj = ctx["req_obj"] = _build_req_obj(pre)
+    return obj
+
 def _build_res_obj(resp) -> Dict[str, Any]:
     headers: Dict[str, Any] = {}
     status = None
@@ -603,7 +1160,7 @@ def _build_res_obj(resp) -> Dict[str, Any]:
     
     return {
         "status": status, "reason": reason, "headers": headers,
-        "body": body_text[:8000] if isinstance(body_text, str) else "",
+        "body": body_text[:_RES_BODY_CAP] if isinstance(body_text, str) else "",
         "content_type": headers.get("Content-Type") if isinstance(headers, dict) else None,
     }
 
@@ -630,6 +1187,36 @@ def _dedupe(items: List[Any]) -> List[Any]:
         out.append(f)
     return out
 
+# Pattern engine reuse: building the engine compiles every pattern file,
+# which used to happen per analyzed response. The singleton is rebuilt
+# only when something under the pattern dir changes (dir or file mtime).
+_PATTERN_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "detectors", "patterns")
+_PATTERN_ENGINE: Optional[Any] = None
+_PATTERN_ENGINE_MTIME: float = -1.0
+
+def _patterns_mtime() -> float:
+    mtime = os.path.getmtime(_PATTERN_DIR)
+    with os.scandir(_PATTERN_DIR) as entries:
+        for entry in entries:
+            m = entry.stat().st_mtime
+            if m > mtime:
+                mtime = m
+    return mtime
+
+def _get_pattern_engine():
+    global _PATTERN_ENGINE, _PATTERN_ENGINE_MTIME
+    try:
+        mtime = _patterns_mtime()
+    except OSError:
+        return None
+    if _PATTERN_ENGINE is None or mtime != _PATTERN_ENGINE_MTIME:
+        from detectors.pattern_engine import PatternEngine
+        engine = PatternEngine(_PATTERN_DIR)
+        engine.reload()
+        _PATTERN_ENGINE = engine
+        _PATTERN_ENGINE_MTIME = mtime
+    return _PATTERN_ENGINE
+
 def analyze_and_record(
     pid: str,
     pre: Dict[str, Any],
@@ -641,12 +1228,24 @@ def analyze_and_record(
     Records findings to disk for the given project id.
     """
     ts = _now_iso()
-    req_obj = _build_req_obj(pre)
+    int_time = int(time.time())   # one clock read shared by all run ids below
+    # res_obj is the detectors' input and is always built; req_obj only
+    # decorates emitted Findings and is built lazily via _req_obj.
     res_obj = _build_res_obj(resp) if resp is not None else {"status": None, "reason": None, "headers": {}, "body": "", "content_type": None}
 
-    ctx = {"pid": pid, "req_obj": req_obj, "res_obj": res_obj}
+    ctx = {"pid": pid, "ts": ts, "res_obj": res_obj}
 
     findings: List[Dict[str, Any]] = []
+    # Dedupe as findings are recorded (same key as _dedupe) instead of
+    # re-scanning the whole list in a second pass at the end.
+    seen_keys: set = set()
+
+    def _record(norm: Dict[str, Any]) -> None:
+        k = (norm.get("detector_id"), norm.get("url"), norm.get("title"))
+        if k not in seen_keys:
+            seen_keys.add(k)
+            findings.append(norm)
+
     # Error channel
     if error:
         exception_finding = Finding(
@@ -655,25 +1254,53 @@ def analyze_and_record(
             detector_id="exception", title="Request error",
             severity="medium", owasp=None, detail=error, evidence=_snippet(error),
             method=pre.get("method"), url=pre.get("url"),
-            status=res_obj.get("status"), req=req_obj, res=res_obj, tags=["exception"]
+            status=res_obj.get("status"), req=_req_obj(pre, ctx), res=res_obj, tags=["exception"]
         )
         # Convert Finding object to dict and normalize
         finding_dict = exception_finding.asdict()
-        from utils.findings_normalize import normalize_finding
         normalized = normalize_finding(
             finding_dict,
             pid=pid,
-            run_id=f"exception_{int(time.time())}",
+            run_id=f"exception_{int_time}",
             method=pre.get("method", "GET"),
             url=pre.get("url", ""),
             status_code=res_obj.get("status")
         )
-        findings.append(normalized)
+        _record(normalized)
+
+    # Passive detectors. The capability mask skips detectors whose cheap
+    # preconditions can't be met (e.g. body scanners on empty bodies).
+    caps = {
+        "body": bool(res_obj.get("body")),
+        "headers": bool(res_obj.get("headers")),
+        "status_2xx": 200 <= (res_obj.get("status") or 0) < 300,
+    }
+    runnable = [
+        (fn, meta)
+        for fn, meta, needs in zip(_DET_FNS, _DET_META, _DET_NEEDS)
+        if not needs or all(caps.get(n) for n in needs)
+    ]
+    if len(runnable) > 1 and _parallel_detectors_enabled():
+        # Prime the shared ctx caches on this thread so the workers only
+        # read them instead of racing to compute the same scans.
+        if caps["body"]:
+            _body_scan(res_obj, ctx)
+            _req_tokens(pre, ctx)
+        if caps["headers"]:
+            _res_headers_lc(res_obj, ctx)
+        if caps["status_2xx"]:
+            _req_headers_lc(pre, ctx)
+        pool = _get_det_pool()
+        futures = [pool.submit(_drain_detector, fn, pre, res_obj, ctx) for fn, _ in runnable]
+    else:
+        futures = None
 
-    # Passive detectors
-    for det_id, fn, meta in _DETECTORS:
+    for i, (fn, meta) in enumerate(runnable):
         try:
-            for f in fn(pre, res_obj, ctx) or []:
+            # Materialize up front: one generator drain per detector
+            # instead of interleaved send/resume per finding.
+            items = futures[i].result() if futures is not None else _drain_detector(fn, pre, res_obj, ctx)
+            for f in items:
                 # inherit OWASP/API/CWE metadata defaults from decorator if finder didn't set them
                 if not f.owasp and meta.get("owasp"): f.owasp = meta["owasp"]
                 if not f.owasp_api and meta.get("owasp_api"): f.owasp_api = meta["owasp_api"]
@@ -681,29 +1308,23 @@ def analyze_and_record(
                 
                 # Convert Finding object to dict and normalize
                 finding_dict = f.asdict()
-                from utils.findings_normalize import normalize_finding
                 normalized = normalize_finding(
                     finding_dict,
                     pid=pid,
-                    run_id=f"legacy_{int(time.time())}",
+                    run_id=f"legacy_{int_time}",
                     method=pre.get("method", "GET"),
                     url=pre.get("url", ""),
                     status_code=res_obj.get("status")
                 )
-                findings.append(normalized)
+                _record(normalized)
         except Exception:
             # detector errors are non-fatal
             continue
 
     # Pattern engine enrichment (new) - use enhanced pattern engine
     try:
-        base_dir = os.path.dirname(os.path.abspath(__file__))
-        pattern_dir = os.path.join(base_dir, "detectors", "patterns")
-        if os.path.isdir(pattern_dir):
-            from detectors.pattern_engine import PatternEngine
-            engine = PatternEngine(pattern_dir)
-            engine.reload()  # Ensure patterns are loaded
-            
+        engine = _get_pattern_engine()
+        if engine is not None:
             # Prepare request/response data for pattern engine
             req_blob = {
                 "url": pre.get("url"),
@@ -729,25 +1350,23 @@ def analyze_and_record(
             # Convert pattern findings using normalize_finding
             for pf in pattern_findings:
                 # Use normalize_finding to ensure schema compliance
-                from utils.findings_normalize import normalize_finding
                 normalized = normalize_finding(
                     pf,
                     pid=pid,
-                    run_id=f"pattern_{int(time.time())}",  # Generate run_id for pattern findings
+                    run_id=f"pattern_{int_time}",
                     method=pre.get("method", "GET"),
                     url=pre.get("url", ""),
                     status_code=res_obj.get("status")
                 )
-                findings.append(normalized)
+                _record(normalized)
     except Exception as e:
         # Pattern engine errors are non-fatal, but log them for debugging
         logger.warning(f"PATTERN_ENGINE_ERROR pid={pid} error={str(e)}")
         pass
 
-    findings = _dedupe(findings)
     if findings:
-        # All findings are already normalized dicts
-        append_findings(pid, findings)
+        # All findings are already normalized dicts; batched to disk
+        _buffer_findings(pid, findings)
         return findings
 
 # ============================================================
@@ -796,221 +1415,156 @@ class PayloadSource:
 # OWASP category explanations
 # ===========================
 
-OWASP_WEB_DETAILS = {
-    "A01:2021-Broken Access Control": {
-        "what": "Access controls are missing or ineffective (IDOR, forced browsing, privilege escalation).",
-        "why": "Business rules aren’t consistently enforced at the resource level.",
-        "risk": "Unauthorized data access/modification; lateral movement across roles/tenants.",
-        "validate": "Attempt actions as a different/unauthenticated user; verify object and function authorization is enforced.",
-        "remediate": [
-            "Deny-by-default: authorize every request server-side.",
-            "Enforce ownership checks on object/resource access.",
-            "Centralize authorization and test negative cases.",
-        ],
-    },
-    "A02:2021-Cryptographic Failures": {
-        "what": "Weak or missing cryptography for data at rest/in transit.",
-        "why": "Improper TLS/cipher choices, missing encryption, or key mishandling expose data.",
-        "risk": "Sensitive data disclosure, MITM attacks, compliance failures.",
-        "validate": "Inspect TLS config, key usage, and data at rest encryption; verify secrets handling & rotation.",
-        "remediate": [
-            "Use TLS 1.2+ with strong ciphers; HSTS on web.",
-            "Encrypt sensitive data at rest; manage keys securely.",
-            "Avoid custom crypto; follow platform best practices.",
-        ],
-    },
-    "A03:2021-Injection": {
-        "what": "Untrusted data is interpreted as commands (SQL/NoSQL/LDAP/OS/template).",
-        "why": "Concatenated queries or unsafe sinks allow attacker-controlled execution.",
-        "risk": "Data exfiltration, corruption, RCE depending on sink.",
-        "validate": "Fuzz parameters with meta-characters; look for errors, blind behaviors, or data leakage.",
-        "remediate": [
-            "Use parameterized queries/ORM binding.",
-            "Apply context-aware encoding; avoid dynamic eval.",
-            "Enforce input validation and least privilege.",
-        ],
-    },
-    "A04:2021-Insecure Design": {
-        "what": "Design flaws (not implementation bugs) that ignore threats and misuse cases.",
-        "why": "Missing threat modeling, security requirements, and defense-in-depth.",
-        "risk": "Systemic weaknesses exploitable despite correct code.",
-        "validate": "Review architecture vs. abuse cases; run design reviews and misuse case tests.",
-        "remediate": [
-            "Adopt threat modeling and STRIDE-style reviews.",
-            "Define explicit security requirements and SLAs.",
-            "Layer controls; prefer secure-by-default patterns.",
-        ],
-    },
-    "A05:2021-Security Misconfiguration": {
-        "what": "Insecure defaults, verbose errors, unnecessary features/services enabled.",
-        "why": "Drift, missing hardening, missing headers, or forgotten debug toggles.",
-        "risk": "Information leakage and expanded attack surface.",
-        "validate": "Scan configs, headers, error paths; check for default creds, open consoles, directory listing.",
-        "remediate": [
-            "Baseline hardening and CIS-style benchmarks.",
-            "Remove unused features; lock admin consoles.",
-            "Add security headers; turn off verbose errors.",
-        ],
-    },
-    "A06:2021-Vulnerable and Outdated Components": {
-        "what": "Using components with known vulnerabilities or unsupported versions.",
-        "why": "Old libraries/containers bring exploitable CVEs.",
-        "risk": "RCE, data exposure, or auth bypass via known bugs.",
-        "validate": "SBOM and dependency scan; track CVEs, check image digests.",
-        "remediate": [
-            "Pin versions by digest; patch regularly.",
-            "Automate dependency & image updates.",
-            "Remove unused packages; verify signatures/provenance.",
-        ],
-    },
-    "A07:2021-Identification and Authentication Failures": {
-        "what": "Weak login/session/token management (bruteforce, weak JWTs, session fixation).",
-        "why": "Missing MFA, poor password/lockout policies, long-lived tokens.",
-        "risk": "Account takeover, credential stuffing success.",
-        "validate": "Check MFA, session rotation, lockout, and token claims (`aud`, `iss`, TTL).",
-        "remediate": [
-            "Enforce MFA and progressive delays/lockouts.",
-            "Short token TTLs; rotate/validate claims.",
-            "Secure session cookies: HttpOnly, Secure, SameSite.",
-        ],
-    },
-    "A08:2021-Software and Data Integrity Failures": {
-        "what": "Unsigned or unverified updates, insecure CI/CD, or deserialization flaws.",
-        "why": "Trusting untrusted code/data paths without integrity checks.",
-        "risk": "Supply-chain compromise, RCE, persistent tampering.",
-        "validate": "Verify signatures, build provenance, deserialization paths.",
-        "remediate": [
-            "Sign artifacts; verify in deployment.",
-            "Harden CI/CD with least privilege & build provenance.",
-            "Avoid unsafe deserialization; whitelist types.",
-        ],
-    },
-    "A09:2021-Security Logging and Monitoring Failures": {
-        "what": "Insufficient audit logs/alerts to detect or investigate attacks.",
-        "why": "Missing context/retention; noisy or uncorrelated events.",
-        "risk": "Delayed detection and poor incident response.",
-        "validate": "Check coverage, retention, and alerting for auth, admin, data access.",
-        "remediate": [
-            "Log security-relevant events with context.",
-            "Centralize & alert on anomalies; protect logs.",
-            "Rehearse IR playbooks; verify time sync.",
-        ],
-    },
-    "A10:2021-Server-Side Request Forgery": {
-        "what": "Server makes attacker-controlled HTTP requests to internal/external targets.",
-        "why": "URL fetchers trust user input; no egress or metadata service protections.",
-        "risk": "Access to internal networks/IMDS, data exfiltration.",
-        "validate": "Probe egress with internal/IMDS URLs; look for SSRF indicators and timeouts.",
-        "remediate": [
-            "Allowlist destinations; deny raw URLs from users.",
-            "Block IMDS and internal address ranges at egress.",
-            "Normalize & validate URLs; use SSRF-safe libraries.",
-        ],
-    },
-}
+# The table content lives in a sibling JSON blob (regenerate with
+# tools/gen_owasp_tables.py): one C-level parse on first use instead of
+# interpreting hundreds of dict/list-literal opcodes at import.
+_OWASP_TABLES_PATH = os.path.join(
+    os.path.dirname(os.path.abspath(__file__)), "owasp_tables.json"
+)
 
-OWASP_API_DETAILS = {
-    "API1:2023-Broken Object Level Authorization": {
-        "what": "Missing per-object checks (BOLA/IDOR).",
-        "why": "Handlers trust user-provided IDs without verifying ownership.",
-        "risk": "Cross-tenant data access/modification.",
-        "validate": "Swap IDs between users; verify 403/404 and filtered results.",
-        "remediate": [
-            "Enforce ownership checks on every data fetch/update.",
-            "Use opaque identifiers; centralize object ACLs.",
-        ],
-    },
-    "API2:2023-Broken Authentication": {
-        "what": "Weak auth (predictable sessions, weak tokens/secrets, long TTLs).",
-        "why": "Improper credential, token, or session handling.",
-        "risk": "Account takeover, replay and impersonation.",
-        "validate": "Review login flows, token algorithms/claims/rotation, and session cookie flags.",
-        "remediate": [
-            "MFA, short TTLs, rotation; prefer asymmetric JWTs.",
-            "Validate `aud`,`iss`,`exp`; revoke on logout.",
-        ],
-    },
-    "API3:2023-Broken Object Property Level Authorization": {
-        "what": "Field-level reads/writes allowed without fine-grained authorization (BOPLA).",
-        "why": "Server accepts/returns properties regardless of caller's rights.",
-        "risk": "Sensitive fields leaked or modified.",
-        "validate": "Try overposting/overreading disallowed fields.",
-        "remediate": [
-            "Schema-based allowlists; per-field authorization.",
-            "Drop unknown fields; ignore forbidden writes.",
-        ],
-    },
-    "API4:2023-Unrestricted Resource Consumption": {
-        "what": "No effective limits on requests, payloads, CPU, memory, or concurrency.",
-        "why": "Lack of quotas, timeouts, and pagination.",
-        "risk": "DoS or cost spikes.",
-        "validate": "Burst tests and large payloads; look for 429, backoff, and server-side ceilings.",
-        "remediate": [
-            "Rate limits per user/IP/tenant; backpressure and queues.",
-            "Pagination, size/time limits; circuit breakers.",
-        ],
-    },
-    "API5:2023-Broken Function Level Authorization": {
-        "what": "Sensitive functions reachable without proper role checks (BFLA).",
-        "why": "UI-driven auth assumptions; missing server-side role validation.",
-        "risk": "Privilege escalation or unauthorized admin actions.",
-        "validate": "Call privileged endpoints without the expected role; verify denial.",
-        "remediate": [
-            "Enforce server-side RBAC/ABAC for each function.",
-            "Hide is not protect: do not rely on client UI.",
-        ],
-    },
-    "API6:2023-Unrestricted Access to Sensitive Business Flows": {
-        "what": "Critical workflows are open to automation/abuse (e.g., checkout, password reset flows).",
-        "why": "No friction or anomaly checks on sensitive sequences.",
-        "risk": "Fraud, inventory abuse, mass automation.",
-        "validate": "Automate flows; verify CAPTCHAs, anomaly detection, or step-up auth.",
-        "remediate": [
-            "Add friction (rate limits, CAPTCHAs, velocity checks).",
-            "Step-up auth for risky flows.",
-        ],
-    },
-    "API7:2023-Server Side Request Forgery": {
-        "what": "API fetches attacker-controlled URLs (SSRF).",
-        "why": "No URL allowlisting or egress controls.",
-        "risk": "Internal network/IMDS access and data exfiltration.",
-        "validate": "Supply internal/IMDS URLs; check egress/response.",
-        "remediate": [
-            "Allowlist hosts; block link-local & IMDS.",
-            "Normalize & validate URLs; isolate fetchers.",
-        ],
-    },
-    "API8:2023-Security Misconfiguration": {
-        "what": "Insecure defaults, verbose errors, missing headers/config drift.",
-        "why": "Lack of hardening and config management.",
-        "risk": "Info disclosure and broader attack surface.",
-        "validate": "Check headers, errors, consoles, directory listing, default creds.",
-        "remediate": [
-            "Baseline hardening and secrets management.",
-            "Disable debug; add security headers.",
-        ],
-    },
-    "API9:2023-Imprecise Rate Limiting": {
-        "what": "Inconsistent/missing throttling across endpoints or identities.",
-        "why": "Perimeter-only or uneven quotas; lack of 429/Retry-After.",
-        "risk": "Credential stuffing, scraping, resource exhaustion.",
-        "validate": "Burst per-user/IP/tenant; confirm 429 and consistent headers.",
-        "remediate": [
-            "Apply identity-aware quotas and backoff.",
-            "Expose clear 429 semantics and `Retry-After`.",
-        ],
-    },
-    "API10:2023-Unsafe Consumption of APIs": {
-        "what": "Trusting unverified upstream schemas, data, or IDs.",
-        "why": "Weak input validation and insufficient trust boundaries.",
-        "risk": "Data confusion, SSRF via integrations, injection via third-party data.",
-        "validate": "Fuzz upstream integrations and schema mismatches.",
-        "remediate": [
-            "Validate/transform upstream data; pin schemas & versions.",
-            "Use timeouts, retries, and allowlists for egress.",
-        ],
-    },
-}
+@cache
+def _owasp_tables() -> Dict[str, Any]:
+    return read_json(_OWASP_TABLES_PATH, {})
+
+# Shared pool for reference-table text: identical wording repeated
+# across entries (and across the web/api/sub tables) collapses to one
+# interned object each.
+_STR_POOL: Dict[str, str] = {}
+_STR_POOL_REFS = 0
+
+def _pooled(s: str) -> str:
+    global _STR_POOL_REFS
+    _STR_POOL_REFS += 1
+    return _STR_POOL.setdefault(s, sys.intern(s))
+
+def _freeze_entry(v: Dict[str, Any]) -> Dict[str, Any]:
+    from markupsafe import escape
+    out = {
+        k: (tuple(_pooled(b) for b in val) if k == "remediate" else _pooled(val))
+        for k, val in v.items()
+    }
+    rem = out.get("remediate")
+    if rem:
+        # Remediation bullets render on every explanation; pre-join them
+        # once at freeze time so renderers concatenate a cached string
+        # instead of re-escaping the same static text per finding.
+        out["remediate_md"] = _pooled("\n".join(f"- {b}" for b in rem))
+        out["remediate_html"] = _pooled(
+            "<ul>" + "".join(f"<li>{escape(b)}</li>" for b in rem) + "</ul>"
+        )
+    return out
+
+class Explanation:
+    """One subcategory explanation. Slotted, so the static entries skip
+    the per-instance dict; __getitem__/get keep the dict-style renderer
+    call sites working."""
+    __slots__ = ("label", "why", "validate", "remediate",
+                 "remediate_md", "remediate_html")
+
+    def __init__(self, label: str, why: str, validate: str,
+                 remediate: Tuple[str, ...],
+                 remediate_md: str = "", remediate_html: str = "") -> None:
+        self.label = label
+        self.why = why
+        self.validate = validate
+        self.remediate = remediate
+        self.remediate_md = remediate_md
+        self.remediate_html = remediate_html
+
+    def __getitem__(self, key: str) -> Any:
+        try:
+            return getattr(self, key)
+        except AttributeError:
+            raise KeyError(key) from None
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+    def _asdict(self) -> Dict[str, Any]:
+        return {s: getattr(self, s) for s in self.__slots__}
+
+def _freeze_details(table: Dict[str, Dict[str, Any]]) -> Any:
+    """Immutable view of a reference table: interned keys mapping to
+    slotted Explanation entries that can be shared without defensive
+    copies."""
+    frozen = types.MappingProxyType({
+        sys.intern(k): Explanation(**_freeze_entry(v))
+        for k, v in table.items()
+    })
+    logger.debug(f"REF_TABLE_POOL unique={len(_STR_POOL)} refs={_STR_POOL_REFS}")
+    return frozen
+
+class OwaspEntry(NamedTuple):
+    """One OWASP category explanation. Tuple-backed, so the static
+    tables are a fraction of the dict-per-entry footprint and field
+    access skips string hashing; .get keeps dict-style callers working."""
+    what: str
+    why: str
+    risk: str
+    validate: str
+    remediate: Tuple[str, ...]
+    remediate_md: str = ""
+    remediate_html: str = ""
+
+    def get(self, key: str, default: Any = None) -> Any:
+        return getattr(self, key, default)
+
+def _freeze_owasp(table: Dict[str, Dict[str, Any]]) -> Any:
+    frozen = types.MappingProxyType({
+        sys.intern(k): OwaspEntry(**_freeze_entry(v))
+        for k, v in table.items()
+    })
+    logger.debug(f"REF_TABLE_POOL unique={len(_STR_POOL)} refs={_STR_POOL_REFS}")
+    return frozen
+
+@cache
+def _owasp_web() -> Any:
+    """OWASP web category details, built and frozen on first use (PEP
+    562 below): importers that never render explanations skip the
+    allocation entirely."""
+    return _freeze_owasp(_owasp_tables()["web"])
+
+@cache
+def _owasp_api() -> Any:
+    """OWASP API category details; see _owasp_web."""
+    return _freeze_owasp(_owasp_tables()["api"])
+
+def __getattr__(name: str) -> Any:
+    # PEP 562 module __getattr__: the big detail tables materialize on
+    # first attribute access instead of at import.
+    if name == "OWASP_WEB_DETAILS":
+        return _owasp_web()
+    if name == "OWASP_API_DETAILS":
+        return _owasp_api()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+# Structure-of-arrays projection of the web+api tables: the key tuple
+# plus one parallel casefolded tuple per prose field, so a field search
+# scans a flat run of strings instead of walking entry objects. Built
+# on first search to keep the tables themselves lazy.
+@cache
+def _owasp_columns() -> Tuple[Tuple[str, ...], Dict[str, Tuple[str, ...]]]:
+    web, api = _owasp_web(), _owasp_api()
+    keys = tuple(web) + tuple(api)
+    entries = tuple(web.values()) + tuple(api.values())
+    cols = {
+        f: tuple(getattr(e, f).casefold() for e in entries)
+        for f in ("what", "why", "risk", "validate")
+    }
+    return keys, cols
+
+def search_field(field: str, substr: str) -> List[str]:
+    """Category labels whose `field` text contains substr (case-insensitive)."""
+    keys, cols = _owasp_columns()
+    col = cols.get(field)
+    if col is None:
+        return []
+    needle = substr.casefold()
+    return [k for k, text in zip(keys, col) if needle in text]
+
+def search_risk(substr: str) -> List[str]:
+    """Category labels whose risk text mentions substr (case-insensitive)."""
+    return search_field("risk", substr)
 
 # Detector → category hints (used if a detector didn't tag OWASP fields)
 DETECTOR_TO_CATEGORY = {
@@ -1050,6 +1604,72 @@ DETECTOR_TO_CATEGORY = {
     "unsafe_consumption": "API10:2023-Unsafe Consumption of APIs",
 }
 
+# The category labels repeat across these tables and get hashed and
+# compared on every finding; interning makes equality a pointer check
+# and reuses the cached hash (the frozen OWASP table keys are interned
+# too, so backfilled labels share those exact objects).
+DETECTOR_TO_CATEGORY = {
+    sys.intern(k): sys.intern(v) for k, v in DETECTOR_TO_CATEGORY.items()
+}
+
+# Inverse index for "which detectors feed this category" drill-downs:
+# O(1) lookup instead of scanning the forward map per query.
+_CAT_INV: Dict[str, List[str]] = {}
+for _det, _cat in DETECTOR_TO_CATEGORY.items():
+    _CAT_INV.setdefault(_cat, []).append(_det)
+CATEGORY_TO_DETECTORS = types.MappingProxyType(
+    {k: tuple(v) for k, v in _CAT_INV.items()}
+)
+del _CAT_INV
+
+# Detector categorization matches needles as substrings, first declared
+# needle wins. The optional Aho-Corasick automaton (same package as the
+# body-scan literals) finds every contained needle in one pass over the
+# detector name; without it the original declaration-order scan runs.
+_DET_CAT_ITEMS = tuple(DETECTOR_TO_CATEGORY.items())
+if ahocorasick is not None:
+    _DET_CAT_AC = ahocorasick.Automaton()
+    for _rank, (_needle, _cat) in enumerate(_DET_CAT_ITEMS):
+        _DET_CAT_AC.add_word(_needle, (_rank, _cat))
+    _DET_CAT_AC.make_automaton()
+else:
+    _DET_CAT_AC = None
+
+# Without the automaton the fallback is still a single C-level scan: one
+# compiled alternation with the escaped needles as alternatives in
+# declaration order (so each position reports its earliest-declared
+# needle) inside a zero-width lookahead (so overlapping hits all show
+# up). Group g<rank> indexes back into _DET_CAT_ITEMS.
+_DET_CAT_RE = re.compile(
+    "(?=(?:"
+    + "|".join(
+        f"(?P<g{_rank}>{re.escape(_needle)})"
+        for _rank, (_needle, _cat) in enumerate(_DET_CAT_ITEMS)
+    )
+    + "))"
+)
+
+def category_for_detector(det: str) -> Optional[str]:
+    """Category hint for a detector id: exact key hit, then the first
+    declared needle contained in the name."""
+    cat = DETECTOR_TO_CATEGORY.get(det)
+    if cat is not None:
+        return cat
+    if _DET_CAT_AC is not None:
+        best: Optional[Tuple[int, str]] = None
+        for _, payload in _DET_CAT_AC.iter(det):
+            if best is None or payload[0] < best[0]:
+                best = payload
+        return best[1] if best is not None else None
+    best_rank: Optional[int] = None
+    for m in _DET_CAT_RE.finditer(det):
+        rank = int(m.lastgroup[1:])
+        if best_rank is None or rank < best_rank:
+            best_rank = rank
+            if rank == 0:
+                break
+    return _DET_CAT_ITEMS[best_rank][1] if best_rank is not None else None
+
 # CWE fallback mapping for detectors (used to backfill older persisted items)
 DETECTOR_TO_CWE = {
     "sec_headers_missing": "CWE-693",
@@ -1065,194 +1685,38 @@ DETECTOR_TO_CWE = {
     "exception": None,
 }
 
+DETECTOR_TO_CWE = {
+    sys.intern(k): (sys.intern(v) if isinstance(v, str) else v)
+    for k, v in DETECTOR_TO_CWE.items()
+}
+
 # ------------------------------
 # Subcategory mini explanations
 # ------------------------------
 
-_SUBCASE_EXPL = {
-    # Misconfiguration
-    "cors:*+credentials": {
-        "label": "CORS: wildcard origin + credentials",
-        "why": "Any site can read authenticated responses via the victim’s browser.",
-        "validate": "Check `Access-Control-Allow-Origin` and `Access-Control-Allow-Credentials` on an authenticated call.",
-        "remediate": [
-            "Use a strict allowlist of origins.",
-            "Do not combine `Allow-Credentials: true` with wildcard/broad origins.",
-        ],
-    },
-    "cors:reflected-origin": {
-        "label": "CORS: origin reflection without validation",
-        "why": "Server reflects arbitrary `Origin`, enabling cross-site reads.",
-        "validate": "Send random `Origin`; verify ACAO echoes it without allowlist enforcement.",
-        "remediate": ["Validate and restrict origins; avoid dynamic echo."],
-    },
-    "headers:security-missing": {
-        "label": "Security headers missing",
-        "why": "Missing CSP, XFO, XCTO, RP, HSTS, etc., weaken client-side defenses.",
-        "validate": "Inspect response headers for the baseline set.",
-        "remediate": ["Set CSP, X-Frame-Options, X-Content-Type-Options, Referrer-Policy, HSTS."],
-    },
-    "stacktrace:leak": {
-        "label": "Debug stack trace leaked",
-        "why": "Reveals internal code paths and libraries.",
-        "validate": "Trigger error and confirm stack trace is suppressed.",
-        "remediate": ["Disable debug; return generic errors; capture details server-side only."],
-    },
-    "dirlisting:enabled": {
-        "label": "Directory listing enabled",
-        "why": "Exposes files/structure and aids recon.",
-        "validate": "Browse to the path; verify index listing disabled.",
-        "remediate": ["Disable auto-index; restrict access; serve explicit index files."],
-    },
-    # Injection / reflection
-    "sql:error-leak": {
-        "label": "SQL error leaked",
-        "why": "Suggests unsafe query construction or unhandled DB exceptions.",
-        "validate": "Fuzz inputs; verify generic error handling post-fix.",
-        "remediate": ["Parametrized queries; generic errors; limit DB privileges."],
-    },
-    "xss:reflected-html": {
-        "label": "Reflected input in HTML context",
-        "why": "May enable XSS if not encoded per context.",
-        "validate": "Inject harmless payload (e.g., `<x onxxx=1>`) and review sink.",
-        "remediate": ["Contextual output encoding; avoid dangerous sinks; CSP."],
-    },
-    "reflection:json": {
-        "label": "Reflected input in JSON response",
-        "why": "Echoed values in JSON can aid data leakage or serve as an injection primitive downstream.",
-        "validate": "Supply a unique marker in parameters and verify it appears verbatim in JSON fields.",
-        "remediate": ["Validate inputs; avoid blindly echoing untrusted data; enforce output schemas."],
-    },
-    "reflection:script": {
-        "label": "Reflected input in <script> context",
-        "why": "High-risk XSS vector if values reach inline scripts without encoding.",
-        "validate": "Inject benign JS identifiers and confirm they appear inside script blocks.",
-        "remediate": ["Avoid inline scripts; use templates with proper encoding; apply strict CSP."],
-    },
-    "reflection:event_attr": {
-        "label": "Reflected input in event handler attribute",
-        "why": "High-risk XSS vector in on* attributes if not encoded.",
-        "validate": "Place a harmless token in input and confirm presence in on* attribute value.",
-        "remediate": ["Sanitize/encode attribute contexts; avoid concatenation into event handlers."],
-    },
-    "reflection:url_attr": {
-        "label": "Reflected input in URL attribute",
-        "why": "May enable open redirects or script URL injection depending on usage.",
-        "validate": "Check href/src attributes containing user-controlled values.",
-        "remediate": ["Validate URLs against allowlists; encode attribute values; disallow javascript: URLs."],
-    },
-    "reflection:text": {
-        "label": "Reflected input in HTML text",
-        "why": "Lower-risk reflection; still useful for phishing or information leaks.",
-        "validate": "Ensure plain text is encoded; verify no HTML interpretation.",
-        "remediate": ["HTML-encode untrusted text; avoid mixing markup and data."],
-    },
-    # Auth / JWT
-    "jwt:none": {
-        "label": "JWT `alg:none` or unsigned",
-        "why": "Tokens can be forged without secret/key.",
-        "validate": "Decode header; confirm `alg`.",
-        "remediate": ["Use RS256/ES256; reject `none`; enforce signature verification."],
-    },
-    "server:header-disclosure": {
-        "label": "Server/X-Powered-By header disclosed",
-        "why": "Reveals technology stack and versions to attackers.",
-        "validate": "Inspect response headers for `Server`/`X-Powered-By` values.",
-        "remediate": ["Remove/obfuscate identifying headers; standardize via reverse proxy."],
-    },
-    "jwt:weak-hs": {
-        "label": "JWT HS* with weak/shared secret",
-        "why": "Brute force or reuse across services possible.",
-        "validate": "Assess secret entropy, rotation, and isolation.",
-        "remediate": ["Prefer asymmetric signing; rotate secrets; scope keys per service."],
-    },
-    "pii:observed": {
-        "label": "Potential PII observed in response",
-        "why": "Exposure of emails/SSNs/credit cards can violate privacy and compliance.",
-        "validate": "Search responses for PII regex matches; confirm accidental leakage.",
-        "remediate": ["Mask redaction; minimize data; apply access controls and encryption."],
-    },
-    "jwt:missing-claims": {
-        "label": "JWT missing critical claims",
-        "why": "Replay or audience confusion risks.",
-        "validate": "Check `aud`,`iss`,`exp`,`iat`.",
-        "remediate": ["Validate claims; set short TTLs; rotate keys."],
-    },
-    # Rate limiting
-    "rate:missing-429": {
-        "label": "No 429 or throttling headers",
-        "why": "Brute force and resource exhaustion become trivial.",
-        "validate": "Burst traffic and look for 429/`Retry-After`/`X-RateLimit-*`.",
-        "remediate": ["Apply quotas per user/IP/tenant; send 429 with retry hints."],
-    },
-    "rate:inconsistent": {
-        "label": "Inconsistent rate limiting",
-        "why": "Allows bypass via method/route variations.",
-        "validate": "Vary paths/methods; confirm consistent throttling.",
-        "remediate": ["Centralize rate limiting; normalize routes/identities."],
-    },
-    # BOLA / BFLA / BOPLA
-    "bola:predictable-id": {
-        "label": "Predictable or enumerable object IDs",
-        "why": "Attackers can access other users’ objects.",
-        "validate": "Swap IDs; expect 403/404 if unauthorized.",
-        "remediate": ["Opaque IDs; enforce ownership checks server-side."],
-    },
-    "bfla:admin-function-exposed": {
-        "label": "Privileged function lacks role checks",
-        "why": "Enables privilege escalation through hidden endpoints.",
-        "validate": "Invoke function without role; verify denial.",
-        "remediate": ["Server-side RBAC/ABAC; defense beyond UI hiding."],
-    },
-    "bopla:overposting": {
-        "label": "Overposting/overreading fields",
-        "why": "Sensitive fields can be written/read without permission.",
-        "validate": "Send extra fields; inspect unexpected reads.",
-        "remediate": ["Whitelist schema; per-field authorization; drop unknown fields."],
-    },
-    # SSRF
-    "ssrf:imds": {
-        "label": "SSRF to metadata service",
-        "why": "Can expose cloud credentials and instance data.",
-        "validate": "Probe IMDS IPs; confirm blocked at egress.",
-        "remediate": ["Block IMDS routes; allowlist hosts; sanitize URLs."],
-    },
-    "ssrf:internal-ip": {
-        "label": "SSRF to internal IP space",
-        "why": "Pivot into internal networks.",
-        "validate": "Test RFC1918/IPv6 link-local; verify denies.",
-        "remediate": ["Deny private ranges at egress; normalize/validate URLs."],
-    },
-    # Logging/monitoring
-    "logging:insufficient": {
-        "label": "Insufficient audit logging",
-        "why": "Detection and investigations are impeded.",
-        "validate": "Check coverage/retention for auth/admin/data access.",
-        "remediate": ["Centralize logs; alert on anomalies; protect logs at rest."],
-    },
-    # Components
-    "deps:outdated": {
-        "label": "Outdated/vulnerable components",
-        "why": "Known CVEs are exploitable.",
-        "validate": "Scan SBOM/deps; check CVE feeds.",
-        "remediate": ["Pin and update; remove unused; verify signatures/provenance."],
-    },
-    "bola:heuristic": {
-        "label": "Possibly unprotected object endpoint (heuristic)",
-        "why": "Object-like endpoints responding without authorization checks may allow IDOR/BOLA.",
-        "validate": "Call with another user's ID without auth; expect 403/404 if protected.",
-        "remediate": ["Enforce per-object authorization; use opaque IDs; centralize checks."],
-    },
-    "exception:error": {
-        "label": "Request error during call",
-        "why": "Network or server errors may indicate instability or misconfiguration.",
-        "validate": "Reproduce errors; inspect logs for root cause.",
-        "remediate": ["Harden error handling; add retries/backoff; fix server-side exceptions."],
-    },
-}
+_SUBCASE_EXPL = _freeze_details(_owasp_tables()["sub"])
+
+# Numeric subcase ids in declaration order: call sites that know the
+# subcase statically index _SUBCASE_TABLE by enum instead of hashing a
+# composite string key per finding. The string-keyed dict stays for
+# dynamically derived keys (see _subcat_key_for_finding).
+_SUBCASE_KEY_ORDER = tuple(_SUBCASE_EXPL)
+_SUBCASE_TABLE = tuple(_SUBCASE_EXPL[k] for k in _SUBCASE_KEY_ORDER)
+
+def _subcase_enum_name(key: str) -> str:
+    return re.sub(r"[^A-Z0-9]+", "_", key.upper()).strip("_")
+
+Subcase = IntEnum(
+    "Subcase",
+    {_subcase_enum_name(k): i for i, k in enumerate(_SUBCASE_KEY_ORDER)},
+)
+
+def subcase_expl(sub: "Subcase") -> Any:
+    """O(1) positional lookup of a subcase explanation by enum id."""
+    return _SUBCASE_TABLE[sub]
 
-# Security header baseline used by missing-headers logic
-_SEC_HEADER_BASELINE = [
+# Security header baseline used by missing-headers logic (display order)
+_SEC_HEADER_BASELINE = (
     "Content-Security-Policy",
     "X-Frame-Options",
     "X-Content-Type-Options",
@@ -1263,7 +1727,11 @@ _SEC_HEADER_BASELINE = [
     "Cross-Origin-Opener-Policy",
     "Cross-Origin-Embedder-Policy",
     "Cross-Origin-Resource-Policy",
-]
+)
+
+# (display name, lowercase) pairs so the per-response audit loop never
+# re-lowercases the baseline names.
+_SEC_HEADER_BASELINE_PAIRS = tuple((h, h.lower()) for h in _SEC_HEADER_BASELINE)
 
 # ===========================
 # Evidence & mini-case utils
@@ -1273,10 +1741,10 @@ def _which_missing_headers(res_headers: dict) -> list:
     """Compare response headers with our baseline and list which are missing/misconfigured."""
     missing = []
     if not isinstance(res_headers, dict):
-        return _SEC_HEADER_BASELINE[:]  # unknown → assume missing
+        return list(_SEC_HEADER_BASELINE)  # unknown → assume missing
     low = {str(k).lower(): str(v) for k, v in res_headers.items()}
-    for name in _SEC_HEADER_BASELINE:
-        if name.lower() not in low:
+    for name, name_lc in _SEC_HEADER_BASELINE_PAIRS:
+        if name_lc not in low:
             missing.append(name)
     # light quality checks
     if "content-security-policy" in low and "default-src" not in (low.get("content-security-policy") or ""):
@@ -1336,22 +1804,19 @@ def _guess_ssrf_target(pre: dict, req: dict) -> str:
                     return v
     return ""
 
-def _mini_block(key: str) -> str:
-    meta = _SUBCASE_EXPL.get(key)
+def _mini_block(key) -> str:
+    meta = _SUBCASE_TABLE[key] if isinstance(key, Subcase) else _SUBCASE_EXPL.get(key)
     if not meta:
         return ""
-    return _render_mini(meta["label"], meta["why"], None, meta.get("remediate"))
+    return _render_mini(meta["label"], meta["why"], None, meta.get("remediate_html"))
 
-def _render_mini(label: str, why: str, extra: str = None, remediate: list = None) -> str:
+def _render_mini(label: str, why: str, extra: str = None, remediate_html: str = None) -> str:
     from markupsafe import escape
     bits = [f"<li><strong>{escape(label)}:</strong> {escape(why)}"]
     if extra:
         bits.append(f" <span class='muted'>{extra}</span>")
-    if remediate:
-        bits.append("<ul>")
-        for r in remediate:
-            bits.append(f"<li>{escape(r)}</li>")
-        bits.append("</ul>")
+    if remediate_html:
+        bits.append(remediate_html)
     bits.append("</li>")
     return "".join(bits)
 
@@ -1423,10 +1888,9 @@ def _build_subcase_appendix(f: dict) -> str:
     if primary_key == "headers:security-missing":
         # Enrich with actual missing list
         missing = _which_missing_headers(headers)
-        label = _SUBCASE_EXPL[primary_key]["label"]
-        why = _SUBCASE_EXPL[primary_key]["why"]
-        remed = _SUBCASE_EXPL[primary_key]["remediate"]
-        bullets.append(_render_mini(label, why, f"Missing: {escape(', '.join(missing))}.", remed))
+        meta = subcase_expl(Subcase.HEADERS_SECURITY_MISSING)
+        bullets.append(_render_mini(meta["label"], meta["why"],
+                                    f"Missing: {escape(', '.join(missing))}.", meta["remediate_html"]))
     elif primary_key:
         bullets.append(_mini_block(primary_key))
 
@@ -1437,26 +1901,25 @@ def _build_subcase_appendix(f: dict) -> str:
     if allow_generic:
         c = _cors_status(headers)
         if c.get("wildcard_with_creds"):
-            bullets.append(_mini_block("cors:*+credentials"))
+            bullets.append(_mini_block(Subcase.CORS_CREDENTIALS))
         elif c.get("reflected"):
-            bullets.append(_mini_block("cors:reflected-origin"))
+            bullets.append(_mini_block(Subcase.CORS_REFLECTED_ORIGIN))
 
     # Missing headers
     if allow_generic:
         missing = _which_missing_headers(headers)
         if missing:
-            label = _SUBCASE_EXPL["headers:security-missing"]["label"]
-            why = _SUBCASE_EXPL["headers:security-missing"]["why"]
-            remed = _SUBCASE_EXPL["headers:security-missing"]["remediate"]
-            bullets.append(_render_mini(label, why, f"Missing: {escape(', '.join(missing))}.", remed))
+            meta = subcase_expl(Subcase.HEADERS_SECURITY_MISSING)
+            bullets.append(_render_mini(meta["label"], meta["why"],
+                                        f"Missing: {escape(', '.join(missing))}.", meta["remediate_html"]))
 
     # SQL error leakage
     if allow_generic and isinstance(body, str) and any(sig in body.lower() for sig in ("sql syntax", "syntax error", "psql:", "postgres", "sqlite", "mysql", "odbc", "ora-")):
-        bullets.append(_mini_block("sql:error-leak"))
+        bullets.append(_mini_block(Subcase.SQL_ERROR_LEAK))
 
     # XSS reflection hints
     if _normalize_subcategory(f.get("subcategory")).startswith("reflection") and any(ch in (f.get("evidence") or "") for ch in "<>\"'"):
-        bullets.append(_mini_block("xss:reflected-html"))
+        bullets.append(_mini_block(Subcase.XSS_REFLECTED_HTML))
 
     # JWT quick hints
     if allow_generic and auth.startswith("Bearer "):
@@ -1464,48 +1927,47 @@ def _build_subcase_appendix(f: dict) -> str:
         alg = (j.get("alg") or "").upper()
         claims = j.get("claims") or {}
         if alg == "NONE":
-            bullets.append(_mini_block("jwt:none"))
+            bullets.append(_mini_block(Subcase.JWT_NONE))
         elif alg.startswith("HS"):
-            bullets.append(_mini_block("jwt:weak-hs"))
+            bullets.append(_mini_block(Subcase.JWT_WEAK_HS))
         missing_claims = [x for x in ("aud", "iss", "exp", "iat") if x not in claims]
         if missing_claims:
-            label = _SUBCASE_EXPL["jwt:missing-claims"]["label"]
-            why = _SUBCASE_EXPL["jwt:missing-claims"]["why"]
-            remed = _SUBCASE_EXPL["jwt:missing-claims"]["remediate"]
-            bullets.append(_render_mini(label, why, f"Missing claims: {escape(', '.join(missing_claims))}.", remed))
+            meta = subcase_expl(Subcase.JWT_MISSING_CLAIMS)
+            bullets.append(_render_mini(meta["label"], meta["why"],
+                                        f"Missing claims: {escape(', '.join(missing_claims))}.", meta["remediate_html"]))
 
     # Rate limit hints
     if allow_generic:
         rl = _rate_limit_status(headers)
         if not rl["has_429_hints"]:
-            bullets.append(_mini_block("rate:missing-429"))
+            bullets.append(_mini_block(Subcase.RATE_MISSING_429))
         elif rl["x_rate"] and rl["retry_after"] is None:
-            bullets.append(_mini_block("rate:inconsistent"))
+            bullets.append(_mini_block(Subcase.RATE_INCONSISTENT))
 
     # SSRF hints
     if allow_generic:
         target = _guess_ssrf_target(pre, pre)
         if target.startswith("http://169.254.169.254") or target.startswith("http://169.254.170.2"):
-            bullets.append(_mini_block("ssrf:imds"))
+            bullets.append(_mini_block(Subcase.SSRF_IMDS))
         elif any(target.startswith(p) for p in ("http://10.", "http://172.16.", "http://192.168.", "http://[fd", "http://[fe80")):
-            bullets.append(_mini_block("ssrf:internal-ip"))
+            bullets.append(_mini_block(Subcase.SSRF_INTERNAL_IP))
 
     # BOLA/BFLA/BOPLA hints – rely on subcategory text if present
     if allow_generic:
         sub = _normalize_subcategory(f.get("subcategory"))
         if "predictable id" in sub or "enumerable" in sub:
-            bullets.append(_mini_block("bola:predictable-id"))
+            bullets.append(_mini_block(Subcase.BOLA_PREDICTABLE_ID))
         if "admin function" in sub or "role check" in sub:
-            bullets.append(_mini_block("bfla:admin-function-exposed"))
+            bullets.append(_mini_block(Subcase.BFLA_ADMIN_FUNCTION_EXPOSED))
         if "overpost" in sub or "property level" in sub or "field-level" in sub:
-            bullets.append(_mini_block("bopla:overposting"))
+            bullets.append(_mini_block(Subcase.BOPLA_OVERPOSTING))
 
     # Directory listing / stack trace
     if allow_generic:
         if "directory index" in sub or "dir listing" in sub:
-            bullets.append(_mini_block("dirlisting:enabled"))
+            bullets.append(_mini_block(Subcase.DIRLISTING_ENABLED))
         if "stack trace" in sub or (isinstance(body, str) and "traceback" in body.lower()):
-            bullets.append(_mini_block("stacktrace:leak"))
+            bullets.append(_mini_block(Subcase.STACKTRACE_LEAK))
 
     if not bullets:
         return ""
@@ -1528,14 +1990,17 @@ def get_finding_explanation(f: dict) -> str:
       3) then append evidence-driven mini subcategory snippets.
     Returns HTML (safe to use with |safe in templates).
     """
-    def _assemble_expl(what, why, risk, validate, remediate) -> str:
+    def _assemble_expl(what, why, risk, validate, remediate, remediate_html=None) -> str:
         from markupsafe import escape
         out = []
         if what: out.append(f"<p><strong>What:</strong> {escape(what)}</p>")
         if why: out.append(f"<p><strong>Why it matters:</strong> {escape(why)}</p>")
         if risk: out.append(f"<p><strong>Risk:</strong> {escape(risk)}</p>")
         if validate: out.append(f"<p><strong>How to validate quickly:</strong> {escape(validate)}</p>")
-        if remediate:
+        if remediate_html:
+            # Frozen table entries carry the pre-rendered bullet list.
+            out.append("<p><strong>Remediation:</strong></p>" + remediate_html)
+        elif remediate:
             out.append("<p><strong>Remediation:</strong></p><ul>")
             for r in remediate:
                 out.append(f"<li>{escape(r)}</li>")
@@ -1557,7 +2022,7 @@ def get_finding_explanation(f: dict) -> str:
             # Try to pull from our OWASP blocks as a fallback
             cat_lbl = f.get("owasp") or f.get("owasp_api")
             if cat_lbl:
-                cat = OWASP_API_DETAILS.get(cat_lbl) or OWASP_WEB_DETAILS.get(cat_lbl)
+                cat = _owasp_api().get(cat_lbl) or _owasp_web().get(cat_lbl)
                 if cat and cat.get("risk"):
                     risk_text = cat.get("risk")
         except Exception:
@@ -1644,24 +2109,24 @@ def get_finding_explanation(f: dict) -> str:
     web_lbl = f.get("owasp")
     # if neither exists, try to infer from detector name
     if not api_lbl and not web_lbl and det:
-        for needle, cat in DETECTOR_TO_CATEGORY.items():
-            if needle in det:
-                if cat.startswith("API"):
-                    api_lbl = cat
-                else:
-                    web_lbl = cat
-                break
+        cat = category_for_detector(det)
+        if cat:
+            if cat.startswith("API"):
+                api_lbl = cat
+            else:
+                web_lbl = cat
 
     def _find_category_details(cat_label: str) -> dict:
         if not cat_label:
             return {}
-        if cat_label in OWASP_API_DETAILS:
-            return OWASP_API_DETAILS[cat_label]
-        if cat_label in OWASP_WEB_DETAILS:
-            return OWASP_WEB_DETAILS[cat_label]
+        api, web = _owasp_api(), _owasp_web()
+        if cat_label in api:
+            return api[cat_label]
+        if cat_label in web:
+            return web[cat_label]
         # try by code prefix
         pref = cat_label.split(":")[0]
-        for d in (OWASP_API_DETAILS, OWASP_WEB_DETAILS):
+        for d in (api, web):
             for k, v in d.items():
                 if k.startswith(pref):
                     return v
@@ -1670,7 +2135,7 @@ def get_finding_explanation(f: dict) -> str:
     cat = _find_category_details(api_lbl) or _find_category_details(web_lbl)
     base_html = _assemble_expl(
         cat.get("what"), cat.get("why"), cat.get("risk"),
-        cat.get("validate"), cat.get("remediate"),
+        cat.get("validate"), cat.get("remediate"), cat.get("remediate_html"),
     )
     sub_html = _build_subcase_appendix(f)
     return base_html + sub_html
@@ -1731,13 +2196,12 @@ def group_findings_for_ui(pid: str) -> Dict[str, Any]:
         # Infer missing OWASP category from detector if needed
         if not f.get("owasp") and not f.get("owasp_api"):
             det = (f.get("detector_id") or f.get("detector") or "").lower()
-            for needle, cat in DETECTOR_TO_CATEGORY.items():
-                if needle in det:
-                    if cat.startswith("API"):
-                        f["owasp_api"] = f.get("owasp_api") or cat
-                    else:
-                        f["owasp"] = f.get("owasp") or cat
-                    break
+            cat = category_for_detector(det)
+            if cat:
+                if cat.startswith("API"):
+                    f["owasp_api"] = f.get("owasp_api") or cat
+                else:
+                    f["owasp"] = f.get("owasp") or cat
         # Backfill CWE using detector mapping (with special case for JSON reflection)
         if not f.get("cwe"):
             det = (f.get("detector_id") or f.get("detector") or "").lower()
@@ -1878,13 +2342,12 @@ def get_finding_by_index(pid: str, idx: int) -> Optional[Dict[str, Any]]:
                 f["cwe"] = guess
         if not f.get("owasp") and not f.get("owasp_api"):
             det = (f.get("detector_id") or f.get("detector") or "").lower()
-            for needle, cat in DETECTOR_TO_CATEGORY.items():
-                if needle in det:
-                    if cat.startswith("API"):
-                        f["owasp_api"] = f.get("owasp_api") or cat
-                    else:
-                        f["owasp"] = f.get("owasp") or cat
-                    break
+            cat = category_for_detector(det)
+            if cat:
+                if cat.startswith("API"):
+                    f["owasp_api"] = f.get("owasp_api") or cat
+                else:
+                    f["owasp"] = f.get("owasp") or cat
         return f
     return None
 
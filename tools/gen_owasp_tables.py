@@ -0,0 +1,49 @@
+"""Regenerate owasp_tables.json from the live OWASP reference tables.
+
+findings.py loads the tables from that blob (one C-level JSON parse
+instead of interpreting hundreds of dict-literal opcodes); run this
+after editing table content to write the file back out.
+"""
+import json
+import os
+import sys
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+import findings  # noqa: E402
+
+
+# Fields findings.py derives during its freeze pass; the blob stores
+# only the source content.
+DERIVED = ("remediate_md", "remediate_html")
+
+
+def _plain(table):
+    out = {}
+    for k, v in table.items():
+        if hasattr(v, "_asdict"):
+            v = v._asdict()
+        out[k] = {
+            key: (list(val) if key == "remediate" else val)
+            for key, val in v.items()
+            if key not in DERIVED
+        }
+    return out
+
+
+def main():
+    data = {
+        "web": _plain(findings.OWASP_WEB_DETAILS),
+        "api": _plain(findings.OWASP_API_DETAILS),
+        "sub": _plain(findings._SUBCASE_EXPL),
+    }
+    path = os.path.join(ROOT, "owasp_tables.json")
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(data, f, ensure_ascii=False, indent=2)
+        f.write("\n")
+    print(f"wrote {path}")
+
+
+if __name__ == "__main__":
+    main()
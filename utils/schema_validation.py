@@ -5,10 +5,28 @@ Validates JSON data against schemas before writing
 import json
 import logging
 import os
-from typing import Any, Dict
+import re
+from functools import lru_cache
+from typing import Any, Dict, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Parsed schemas keyed by file path, invalidated on mtime change, so
+# repeated validate_json calls skip the open/json.load round-trip.
+_SCHEMA_CACHE: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+_compile_pattern = lru_cache(maxsize=256)(re.compile)
+
+def _load_schema(schema_file: str) -> Dict[str, Any]:
+    mtime = os.stat(schema_file).st_mtime
+    cached = _SCHEMA_CACHE.get(schema_file)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    with open(schema_file, 'r') as f:
+        schema = json.load(f)
+    _SCHEMA_CACHE[schema_file] = (mtime, schema)
+    return schema
+
 def validate_json(data: Dict[str, Any], schema_path: str, what: str) -> bool:
     """
     Validate JSON data against a schema file.
@@ -28,9 +46,8 @@ def validate_json(data: Dict[str, Any], schema_path: str, what: str) -> bool:
             logger.warning(f"SCHEMA_VALIDATION_FAIL schema_file_not_found={schema_file} what={what}")
             return False
         
-        with open(schema_file, 'r') as f:
-            schema = json.load(f)
-        
+        schema = _load_schema(schema_file)
+
         # Basic validation - check required fields exist
         if isinstance(data, list):
             # For arrays, validate each item
@@ -92,8 +109,7 @@ def _validate_field(value: Any, field_schema: Dict[str, Any], field_path: str) -
     # Pattern validation
     pattern = field_schema.get('pattern')
     if pattern and isinstance(value, str):
-        import re
-        if not re.match(pattern, value):
+        if not _compile_pattern(pattern).match(value):
             logger.warning(f"SCHEMA_VALIDATION_FAIL pattern_mismatch field={field_path} pattern={pattern}")
             return False
     